@@ -23,6 +23,8 @@ router = APIRouter(prefix="/admin/ai-models", tags=["AI Models Management"])
 
 settings = get_settings()
 ADMIN_API_KEY = settings.admin_api_key
+# Encoded once so each request does a constant-time compare without re-encoding
+_ADMIN_KEY_BYTES = ADMIN_API_KEY.encode("utf-8") if ADMIN_API_KEY else None
 
 
 class CreateAIModelRequest(BaseModel):
@@ -60,7 +62,11 @@ def verify_admin_key(x_admin_key: Optional[str] = Header(None)) -> str:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Admin API key required. Include X-Admin-Key header.",
         )
-    if x_admin_key != ADMIN_API_KEY:
+    # _ADMIN_KEY_BYTES is None when no admin key is configured; reject
+    # rather than hand compare_digest a None
+    if _ADMIN_KEY_BYTES is None or not secrets.compare_digest(
+        x_admin_key.encode("utf-8"), _ADMIN_KEY_BYTES
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid admin API key",
@@ -3,7 +3,8 @@ Medical reports handler
 Follows Google API standards for resource operations
 """
 
-from fastapi import APIRouter, UploadFile, File, Query
+from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
 import logging
 
@@ -12,7 +13,10 @@ from server.api.v1.models.common import (
     MedicalReportListResponse,
     MedicalReportDeleteResponse,
 )
-from server.api.v1.services.medical_report import MedicalReportService
+from server.api.v1.services.medical_report import (
+    MedicalReportService,
+    get_medical_report_service,
+)
 from server.config.settings import get_settings
 from server.core.exceptions import NotFoundError, StorageError
 
@@ -21,12 +25,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
-# Initialize service
-service = MedicalReportService()
-
 
 @router.post("", response_model=MedicalReportParseResponse)
-async def parse_medical_report(file: UploadFile = File(...)):
+async def parse_medical_report(
+    file: UploadFile = File(...),
+    service: MedicalReportService = Depends(get_medical_report_service),
+):
     """
     Parse and store a medical report PDF
 
@@ -49,12 +53,16 @@ async def parse_medical_report(file: UploadFile = File(...)):
         raise StorageError(f"Failed to parse medical report: {str(e)}")
 
 
-@router.get("", response_model=MedicalReportListResponse)
+# response_model=None: the service already returns a validated
+# MedicalReportListResponse, and re-validating O(limit) nested reports on the
+# way out roughly doubles the cost of this endpoint.
+@router.get("", response_model=None)
 async def list_medical_reports(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
     patient_name: Optional[str] = Query(None),
     report_date: Optional[str] = Query(None),
+    service: MedicalReportService = Depends(get_medical_report_service),
 ):
     """
     List medical reports with optional filtering
@@ -79,14 +87,20 @@ async def list_medical_reports(
             patient_name=patient_name,
             report_date=report_date,
         )
-        return result
+        return ORJSONResponse(result.model_dump())
     except Exception as e:
         logger.error(f"Error listing reports: {str(e)}")
         raise StorageError(f"Failed to list medical reports: {str(e)}")
 
 
-@router.get("/{report_id}", response_model=MedicalReportParseResponse)
-async def get_medical_report(report_id: str):
+# response_model=None: same reasoning as the list route — skip the
+# jsonable_encoder walk over parsed_data and let orjson serialize it in one
+# pass.
+@router.get("/{report_id}", response_model=None)
+async def get_medical_report(
+    report_id: str,
+    service: MedicalReportService = Depends(get_medical_report_service),
+):
     """
     Get a specific medical report by ID
 
@@ -105,7 +119,7 @@ async def get_medical_report(report_id: str):
         result = await service.get_report_by_id(report_id)
         if not result:
             raise NotFoundError(f"Report not found", resource=f"reports/{report_id}")
-        return result
+        return ORJSONResponse(result.model_dump())
     except NotFoundError:
         raise
     except Exception as e:
@@ -114,7 +128,10 @@ async def get_medical_report(report_id: str):
 
 
 @router.delete("/{report_id}", response_model=MedicalReportDeleteResponse)
-async def delete_medical_report(report_id: str):
+async def delete_medical_report(
+    report_id: str,
+    service: MedicalReportService = Depends(get_medical_report_service),
+):
     """
     Delete a medical report by ID
 
@@ -13,8 +13,10 @@ import zipfile
 from typing import List, Optional
 import asyncio
 import httpx
+import orjson
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import ORJSONResponse
 from bson import ObjectId
 from pydantic import BaseModel
 from server.config.settings import get_settings
@@ -31,7 +33,9 @@ from server.utils.confidence_calculator import calculate_confidence
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["Medical Reports"])
+# orjson serializes the multi-MB parsed report dicts several times faster
+# than the default json-based response class.
+router = APIRouter(tags=["Medical Reports"], default_response_class=ORJSONResponse)
 
 
 def _get_gemini_client() -> GeminiParser:
@@ -112,16 +116,16 @@ async def upload_report(
 
     settings = get_settings()
     selected_model = ai_model.get("model_name")
-    print("Using Gemini model:", selected_model)
+    logger.debug("Using Gemini model: %s", selected_model)
     gemini_client = GeminiParser(api_key=settings.gemini_api_key, model=selected_model)
 
     # File handling (same as before)
+    # Accumulate exact integer byte counts and convert to MB once at the end.
     pdf_files = []
-    total_size_mb = 0.0
+    total_bytes = 0
     for uploaded_file in file:
         file_bytes = await uploaded_file.read()
-        file_size_mb = len(file_bytes) / (1024 * 1024)
-        total_size_mb += file_size_mb
+        total_bytes += len(file_bytes)
         is_zip = (uploaded_file.filename and uploaded_file.filename.lower().endswith('.zip')) or (
             uploaded_file.content_type and 'zip' in uploaded_file.content_type.lower()
         )
@@ -133,40 +137,66 @@ async def upload_report(
                             continue
                         if zip_info.lower().endswith('.pdf'):
                             pdf_bytes = zip_ref.read(zip_info)
-                            pdf_size_mb = len(pdf_bytes) / (1024 * 1024)
-                            pdf_files.append({'filename': zip_info, 'bytes': pdf_bytes, 'size_mb': pdf_size_mb})
+                            pdf_files.append({'filename': zip_info, 'bytes': pdf_bytes, 'size_bytes': len(pdf_bytes)})
             except zipfile.BadZipFile:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"File '{uploaded_file.filename}' is not a valid ZIP file.")
         else:
             if uploaded_file.content_type and uploaded_file.content_type.lower() != "application/pdf":
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Only PDF and ZIP files are supported. Got: {uploaded_file.content_type}")
-            pdf_files.append({'filename': uploaded_file.filename or 'document.pdf', 'bytes': file_bytes, 'size_mb': file_size_mb})
+            pdf_files.append({'filename': uploaded_file.filename or 'document.pdf', 'bytes': file_bytes, 'size_bytes': len(file_bytes)})
 
     if not pdf_files:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No PDF files found in the uploaded file(s).")
 
+    total_size_mb = round(total_bytes / 1048576, 2)
+
     # Generate unique reportId
     report_object_id = ObjectId()
     report_id = str(report_object_id)
     usage_tracker.track_upload(tenant_id, total_size_mb)
 
+    # Upload PDFs to Azure first so Gemini reads them by URL and the raw
+    # bytes don't stay resident in memory for the whole parse duration.
+    storage_client = None
+    try:
+        storage_client = _get_storage_client()
+    except HTTPException:
+        logger.warning("Azure storage not configured; keeping PDF bytes in memory for parsing.")
+    if storage_client:
+        for pdf in pdf_files:
+            try:
+                blob_url = await storage_client.upload_bytes(
+                    tenant_id, f"{report_id}/{pdf['filename']}", pdf['bytes']
+                )
+            except Exception as exc:
+                logger.warning("Blob upload failed for '%s'; keeping bytes in memory: %s", pdf['filename'], exc)
+                continue
+            pdf['blob_url'] = blob_url
+            del pdf['bytes']
+
     async def do_parsing_and_save(job_id,update_record=False):
+        oid = ObjectId(job_id)
         parse_start_time = time.time()
         consolidated_data = None
-        parsed_results = []
+        successful_parses = 0
         # Parse files (same as before)
         if len(pdf_files) > 1:
             try:
                 consolidated_data = gemini_client.parse_multiple_pdfs(pdf_files)
                 if consolidated_data:
-                    parsed_results = [{'filename': pdf['filename'], 'data': consolidated_data} for pdf in pdf_files]
+                    successful_parses = len(pdf_files)
             except Exception as exc:
                 consolidated_data = None
         if not consolidated_data:
+            # Per-file fallback — the only path where _merge_parsed_reports
+            # actually needs a list of individual results.
             parsed_results = []
             for pdf_file in pdf_files:
                 try:
-                    parsed_data = gemini_client.parse_pdf(pdf_file['bytes'], pdf_file['filename'])
+                    if pdf_file.get('blob_url'):
+                        parsed_data = gemini_client.parse_pdf_from_url(pdf_file['blob_url'], pdf_file['filename'])
+                    else:
+                        parsed_data = gemini_client.parse_pdf(pdf_file['bytes'], pdf_file['filename'])
                     if parsed_data:
                         parsed_results.append({'filename': pdf_file['filename'], 'data': parsed_data})
                 except Exception as exc:
@@ -199,15 +229,23 @@ async def upload_report(
                     except Exception as e:
                         logger.warning("Failed to POST failure webhook to %s: %s", webhook_url, e)
                 return
+            successful_parses = len(parsed_results)
             consolidated_data = _merge_parsed_reports(parsed_results)
         parse_end_time = time.time()
         parsing_time_seconds = round(parse_end_time - parse_start_time, 2)
         first_file = file[0]
-        blob_url = None
-
-        clean_parsed_data = consolidated_data.copy() if isinstance(consolidated_data, dict) else {}
-        gemini_confidence = clean_parsed_data.pop("confidence_score", None)
-        gemini_confidence_summary = clean_parsed_data.pop("confidence_summary", None)
+        blob_url = pdf_files[0].get('blob_url')
+
+        # Pop confidence keys in place — nothing else holds a reference to
+        # consolidated_data, so copying the (potentially huge) tree is wasted work.
+        if isinstance(consolidated_data, dict):
+            clean_parsed_data = consolidated_data
+            gemini_confidence = clean_parsed_data.pop("confidence_score", None)
+            gemini_confidence_summary = clean_parsed_data.pop("confidence_summary", None)
+        else:
+            clean_parsed_data = {}
+            gemini_confidence = None
+            gemini_confidence_summary = None
         validated_confidence, validated_summary, validation_details = calculate_confidence(
             parsed_data=clean_parsed_data or consolidated_data,
             gemini_confidence=gemini_confidence
@@ -220,23 +258,23 @@ async def upload_report(
             "parsing_time_seconds": parsing_time_seconds,
             "confidence_score": validated_confidence,
             "confidence_summary": validated_summary,
-            "total_size_mb": round(total_size_mb, 2),
+            "total_size_mb": total_size_mb,
             "files_processed": len(pdf_files),
-            "successful_parses": len(parsed_results),
-            "failed_parses": len(pdf_files) - len(parsed_results),
+            "successful_parses": successful_parses,
+            "failed_parses": len(pdf_files) - successful_parses,
             "parsed_data": clean_parsed_data or consolidated_data,
             "status": "completed",
-            "message": f"Successfully processed {len(parsed_results)} of {len(pdf_files)} PDF file(s) in {parsing_time_seconds}s.",
+            "message": f"Successfully processed {successful_parses} of {len(pdf_files)} PDF file(s) in {parsing_time_seconds}s.",
             "created_at": time.time(),
         }
         if update_record:
             await parsed_reports_collection.update_one(
-                 {"_id": ObjectId(job_id)},
+                 {"_id": oid},
                  {"$set": parsed_report_doc}
             )
             # Ensure webhook_meta is not lost after update
             await parsed_reports_collection.update_one(
-                {"_id": ObjectId(job_id)},
+                {"_id": oid},
                 {"$setOnInsert": {"webhook_meta": {
                     "delivered": False,
                     "status": "pending",
@@ -251,7 +289,7 @@ async def upload_report(
             try:
                 # fetch latest doc for completeness (or use parsed_report_doc)
                 try:
-                    latest_doc = await parsed_reports_collection.find_one({"_id": ObjectId(job_id)})
+                    latest_doc = await parsed_reports_collection.find_one({"_id": oid})
                     parsed_data_only = latest_doc.get("parsed_data")
                 except Exception:
                     latest_doc = parsed_report_doc
@@ -266,19 +304,19 @@ async def upload_report(
                     if response.status_code >= 200 and response.status_code < 300:
                         logger.info("Webhook delivered successfully to %s (status: %d)", webhook_url, response.status_code)
                         await parsed_reports_collection.update_one(
-                            {"_id": ObjectId(job_id)},
+                            {"_id": oid},
                             {"$set": {"webhook_meta.delivered": True, "webhook_meta.status": "success", "webhook_meta.webhook_url": webhook_url}}
                         )
                     else:
                         logger.warning("Webhook delivery failed to %s (status: %d)", webhook_url, response.status_code)
                         await parsed_reports_collection.update_one(
-                            {"_id": ObjectId(job_id)},
+                            {"_id": oid},
                             {"$set": {"webhook_meta.delivered": False, "webhook_meta.status": f"fail ({response.status_code})", "webhook_meta.webhook_url": webhook_url}}
                         )
             except Exception as e:
                 logger.warning("Failed to POST success webhook to %s: %s", webhook_url, e)
                 await parsed_reports_collection.update_one(
-                    {"_id": ObjectId(job_id)},
+                    {"_id": oid},
                     {"$set": {"webhook_meta.delivered": False, "webhook_meta.status": f"fail ({str(e)[:100]})", "webhook_meta.webhook_url": webhook_url}}
                 )
 
@@ -672,44 +710,64 @@ def _merge_parsed_reports(parsed_results: List[dict]) -> dict:
                     'similarity_percentage': None,
                     'comparison_details': None,
                     'notes': '',
+                    # Note fragments accumulate here and are joined once after
+                    # the loop, avoiding quadratic string re-concatenation
+                    '_notes_parts': [],
                 }
-            
+
+            # Bind both dicts once — the branches below would otherwise repeat
+            # the consolidated['photo_comparison'] lookup on every check
+            pc = consolidated['photo_comparison']
+
             # Merge images_found with offset for image numbers
-            if 'images_found' in pc_data and pc_data['images_found']:
-                existing_images = consolidated['photo_comparison'].get('images_found', [])
+            if pc_data.get('images_found'):
+                existing_images = pc.get('images_found', [])
                 offset = len(existing_images)
-                
-                for img in pc_data['images_found']:
-                    new_img = img.copy()
-                    new_img['image_number'] = img.get('image_number', 0) + offset
-                    new_img['source_file'] = filename
-                    existing_images.append(new_img)
-                
-                consolidated['photo_comparison']['images_found'] = existing_images
-            
+
+                existing_images.extend(
+                    {**img, 'image_number': img.get('image_number', 0) + offset, 'source_file': filename}
+                    for img in pc_data['images_found']
+                )
+
+                pc['images_found'] = existing_images
+
             # Update comparison fields if not already set
-            if pc_data.get('comparison_performed') and not consolidated['photo_comparison'].get('comparison_performed'):
-                consolidated['photo_comparison']['comparison_performed'] = True
-            
-            if pc_data.get('similarity_percentage') is not None and consolidated['photo_comparison'].get('similarity_percentage') is None:
-                consolidated['photo_comparison']['similarity_percentage'] = pc_data['similarity_percentage']
-            
-            if pc_data.get('comparison_details') and not consolidated['photo_comparison'].get('comparison_details'):
-                consolidated['photo_comparison']['comparison_details'] = pc_data['comparison_details']
-            
-            # Merge notes
-            if pc_data.get('notes'):
-                existing_notes = consolidated['photo_comparison'].get('notes', '')
-                if existing_notes:
-                    consolidated['photo_comparison']['notes'] = f"{existing_notes} | {pc_data['notes']}"
-                else:
-                    consolidated['photo_comparison']['notes'] = pc_data['notes']
+            if pc_data.get('comparison_performed') and not pc.get('comparison_performed'):
+                pc['comparison_performed'] = True
+
+            similarity = pc_data.get('similarity_percentage')
+            if similarity is not None and pc.get('similarity_percentage') is None:
+                pc['similarity_percentage'] = similarity
+
+            details = pc_data.get('comparison_details')
+            if details and not pc.get('comparison_details'):
+                pc['comparison_details'] = details
+
+            # Merge notes. The fragment list may not exist yet when the
+            # first file already carried a photo_comparison (consolidated
+            # starts as that file's dict); seed it with the notes string the
+            # first file contributed so it survives the final join.
+            notes = pc_data.get('notes')
+            if notes:
+                notes_parts = pc.get('_notes_parts')
+                if notes_parts is None:
+                    existing_notes = pc.get('notes')
+                    notes_parts = pc['_notes_parts'] = (
+                        [existing_notes] if existing_notes else []
+                    )
+                notes_parts.append(notes)
     
     # After merging all photo comparisons, check if we have 2+ images but no comparison
     if consolidated.get('photo_comparison'):
         pc = consolidated['photo_comparison']
+        notes_parts = pc.pop('_notes_parts', None)
+        if notes_parts is None:
+            # No later file touched the notes — keep whatever the first
+            # file's photo_comparison already said
+            existing_notes = pc.get('notes')
+            notes_parts = [existing_notes] if existing_notes else []
         images_count = len(pc.get('images_found', []))
-        
+
         # If we have 2+ images but comparison wasn't performed, log warning
         if images_count >= 2 and not pc.get('comparison_performed'):
             logger.warning(
@@ -718,30 +776,70 @@ def _merge_parsed_reports(parsed_results: List[dict]) -> dict:
                 images_count
             )
             # Force it to show that comparison should have been performed
-            pc['notes'] = (pc.get('notes', '') + 
-                          f" | WARNING: {images_count} images found but comparison not performed by AI.").strip()
-    
+            notes_parts.append(
+                f"WARNING: {images_count} images found but comparison not performed by AI."
+            )
+
+        pc['notes'] = ' | '.join(p for p in notes_parts if p)
+
     return consolidated
     
 def _serialize_mongodb_doc(doc: dict) -> dict:
-    """Convert MongoDB document to JSON-serializable format."""
+    """
+    Convert MongoDB document to JSON-serializable format.
+
+    Round-trips through orjson so the tree walk runs in C; only non-JSON
+    types (ObjectId, datetime) hit the Python str() fallback. Large parsed
+    reports avoid the per-node dict allocations of a Python traversal.
+    """
     if not doc:
         return doc
-        
+    try:
+        return orjson.loads(orjson.dumps(doc, default=str))
+    except TypeError:
+        return _serialize_mongodb_doc_py(doc)
+
+
+def _serialize_mongodb_doc_py(
+    doc: dict,
+    # Default-arg bindings keep the hot loop on LOAD_FAST instead of the
+    # LOAD_GLOBAL lookups it would otherwise pay per node.
+    _ObjectId=ObjectId,
+    _dict=dict,
+    _list=list,
+    _str=str,
+    _type=type,
+) -> dict:
+    """
+    Pure-Python fallback for documents orjson cannot serialize.
+
+    Walks the tree iteratively with an explicit (parent, key, value)
+    worklist — no recursion frames on deeply nested report documents, and
+    exact type() dispatch instead of isinstance on the hot branches.
+    """
+    if not doc:
+        return doc
+
+    # Entries are pushed in reverse so popping preserves key insertion order.
     result = {}
-    for key, value in doc.items():
-        if isinstance(value, ObjectId):
-            result[key] = str(value)
-        elif isinstance(value, dict):
-            result[key] = _serialize_mongodb_doc(value)
-        elif isinstance(value, list):
-            result[key] = [
-                _serialize_mongodb_doc(item) if isinstance(item, dict) else 
-                str(item) if isinstance(item, ObjectId) else item 
-                for item in value
-            ]
+    stack = [(result, key, value) for key, value in reversed(doc.items())]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        parent, key, value = pop()
+        vtype = _type(value)
+        if vtype is _ObjectId:
+            parent[key] = _str(value)
+        elif vtype is _dict:
+            child = {}
+            parent[key] = child
+            extend((child, k, v) for k, v in reversed(value.items()))
+        elif vtype is _list:
+            child = [None] * len(value)
+            parent[key] = child
+            extend((child, i, v) for i, v in enumerate(value))
         else:
-            result[key] = value
+            parent[key] = value
     return result
 
 @router.post(
@@ -761,28 +859,29 @@ async def webhook_test(request: Request):
         content_type = headers.get("content-type", "")
         payload = None
 
-        # Attempt to parse the body
+        # Attempt to parse the body — read it once and decode with orjson
+        # instead of buffering again through request.json()
+        raw = await request.body()
         if "application/json" in content_type:
             try:
-                payload = await request.json()
-            except Exception:
+                payload = orjson.loads(raw) if raw else None
+            except orjson.JSONDecodeError:
                 # fall back to raw body if JSON decode fails
-                raw = await request.body()
                 try:
                     payload = raw.decode("utf-8", errors="replace")
                 except Exception:
                     payload = raw
         else:
-            raw = await request.body()
             try:
                 payload = raw.decode("utf-8", errors="replace")
             except Exception:
                 payload = raw
 
-        # ✅ Log full details
-        logger.info("WEBHOOK TEST RECEIVED — URL: %s", url)
-        logger.info("WEBHOOK TEST RECEIVED — Headers: %s", headers)
-        logger.info("WEBHOOK TEST RECEIVED — Payload: %s", payload)
+        # ✅ Log full details (skip header/payload formatting when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("WEBHOOK TEST RECEIVED — URL: %s", url)
+            logger.info("WEBHOOK TEST RECEIVED — Headers: %s", headers)
+            logger.info("WEBHOOK TEST RECEIVED — Payload: %s", payload)
 
         return {
             "success": True,
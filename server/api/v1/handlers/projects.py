@@ -3,13 +3,16 @@ Projects CRUD API endpoints.
 Tenant-scoped endpoints for managing projects.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, List
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from pymongo import ReturnDocument
 
 from server.config.settings import get_settings
 from server.integrations.mongodb import MongoDBClient
@@ -19,11 +22,13 @@ from server.models.tenant import tenant_manager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["Projects"])
+router = APIRouter(tags=["Projects"], default_response_class=ORJSONResponse)
 
 
 class CreateProjectRequest(BaseModel):
     """Request model for creating a project"""
+    model_config = ConfigDict(extra="forbid")
+
     project_name: str = Field(..., description="Display name of the project")
     description: Optional[str] = Field(None, description="Project description")
     # ai_model_id: str = Field(..., description="Associated AI Model ID")
@@ -31,6 +36,8 @@ class CreateProjectRequest(BaseModel):
 
 class UpdateProjectRequest(BaseModel):
     """Request model for updating a project"""
+    model_config = ConfigDict(extra="forbid")
+
     project_name: Optional[str] = None
     description: Optional[str] = None
     ai_model_id: Optional[str] = None
@@ -39,6 +46,8 @@ class UpdateProjectRequest(BaseModel):
 
 class AssignAIModelRequest(BaseModel):
     """Request model for assigning an AI model to a project"""
+    model_config = ConfigDict(extra="forbid")
+
     ai_model_id: str = Field(..., description="AI Model ID to assign")
 
 
@@ -71,8 +80,8 @@ async def create_project(
             description=request.description,
         )
         
-        # Insert into MongoDB
-        project_dict = project.dict()
+        # Insert into MongoDB; ai_model_id is unset until assign-model runs
+        project_dict = project.model_dump(exclude={"ai_model_id"})
         await projects_collection.insert_one(project_dict)
         
         # Only include the required fields in the response
@@ -83,7 +92,7 @@ async def create_project(
             "description": request.description,
         }
         
-        logger.info(f"Created project '{project_id}' for tenant '{tenant_id}'")
+        logger.info("Created project '%s' for tenant '%s'", project_id, tenant_id)
         
         return ProjectResponse(
             success=True,
@@ -94,7 +103,7 @@ async def create_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating project: {str(e)}")
+        logger.error("Error creating project: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create project: {str(e)}"
@@ -104,36 +113,41 @@ async def create_project(
 @router.get("/tenants/{tenant_id}/projects")
 async def list_projects(
     tenant_id: str,
+    skip: int = Query(0, ge=0, description="Number of projects to skip from the start."),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of projects to return."),
     auth: AuthenticatedTenant = Depends(resolve_tenant),
 ):
     """
-    List all projects for a tenant.
+    List projects for a tenant with pagination.
     """
     try:
         db = await MongoDBClient.get_database()
         projects_collection = db["projects"]
-        
+
         query = {"tenant_id": tenant_id}
-        
-        cursor = projects_collection.find(query)
-        projects = []
-        
-        async for project in cursor:
-            # Remove MongoDB's _id field and ai_model_id, then convert to dict
-            project_dict = dict(project)
-            project_dict.pop('_id', None)
-            project_dict.pop('ai_model_id', None)
-            projects.append(project_dict)
-        
-        return {
+
+        # Project out _id/ai_model_id server-side so the driver never decodes
+        # fields we'd immediately strip. The page fetch and the total count
+        # have no ordering dependency, so overlap the two round-trips.
+        cursor = projects_collection.find(query, projection={"_id": 0, "ai_model_id": 0})
+        projects, total = await asyncio.gather(
+            cursor.skip(skip).limit(limit).to_list(length=limit),
+            projects_collection.count_documents(query),
+        )
+
+        # Serialize directly through orjson — no jsonable_encoder pass over
+        # what is already a plain list of dicts.
+        return ORJSONResponse({
             "success": True,
             "tenant_id": tenant_id,
-            "total_projects": len(projects),
+            "skip": skip,
+            "limit": limit,
+            "total_projects": total,
             "projects": projects
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Error listing projects: {str(e)}")
+        logger.error("Error listing projects: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list projects: {str(e)}"
@@ -153,31 +167,26 @@ async def get_project(
         db = await MongoDBClient.get_database()
         projects_collection = db["projects"]
         
-        project = await projects_collection.find_one({
-            "project_id": project_id,
-            "tenant_id": tenant_id
-        })
-        
+        project = await projects_collection.find_one(
+            {"project_id": project_id, "tenant_id": tenant_id},
+            projection={"_id": 0, "ai_model_id": 0},
+        )
+
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project '{project_id}' not found",
             )
-        
-        # Convert MongoDB document to dict and remove _id
-        project_dict = dict(project)
-        project_dict.pop('_id', None)
-        project_dict.pop('ai_model_id', None)
-        
+
         return {
             "success": True,
-            "data": project_dict
+            "data": project
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving project: {str(e)}")
+        logger.error("Error retrieving project: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve project: {str(e)}"
@@ -198,18 +207,7 @@ async def update_project(
         db = await MongoDBClient.get_database()
         projects_collection = db["projects"]
         ai_models_collection = db["ai_models"]
-        
-        project = await projects_collection.find_one({
-            "project_id": project_id,
-            "tenant_id": tenant_id
-        })
-        
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project '{project_id}' not found",
-            )
-        
+
         # Build update dict
         update_data = {}
         if request.project_name is not None:
@@ -218,53 +216,51 @@ async def update_project(
             update_data["description"] = request.description
         if request.is_active is not None:
             update_data["is_active"] = request.is_active
-        
+
         # Verify AI model if being updated
         if request.ai_model_id is not None:
             ai_model = await ai_models_collection.find_one({
                 "model_id": request.ai_model_id,
                 "tenant_id": tenant_id
             })
-            
+
             if not ai_model:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"AI model '{request.ai_model_id}' not found",
                 )
-            
+
             update_data["ai_model_id"] = request.ai_model_id
-        
+
         update_data["updated_at"] = datetime.utcnow()
-        
-        # Update in MongoDB
-        await projects_collection.update_one(
+
+        # Single round-trip: update and read back the new document atomically
+        # instead of find_one -> update_one -> find_one.
+        updated_project = await projects_collection.find_one_and_update(
             {"project_id": project_id, "tenant_id": tenant_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"_id": 0, "ai_model_id": 0},
+            return_document=ReturnDocument.AFTER,
         )
-        
-        # Fetch updated project
-        updated_project = await projects_collection.find_one({
-            "project_id": project_id,
-            "tenant_id": tenant_id
-        })
-        
-        # Convert MongoDB document to dict and remove _id and ai_model_id
-        updated_project_dict = dict(updated_project)
-        updated_project_dict.pop('_id', None)
-        updated_project_dict.pop('ai_model_id', None)
-        
-        logger.info(f"Updated project '{project_id}' for tenant '{tenant_id}'")
-        
+
+        if updated_project is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project '{project_id}' not found",
+            )
+
+        logger.info("Updated project '%s' for tenant '%s'", project_id, tenant_id)
+
         return ProjectResponse(
             success=True,
-            data=updated_project_dict,
+            data=updated_project,
             message=f"Project '{project_id}' updated successfully"
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating project: {str(e)}")
+        logger.error("Error updating project: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update project: {str(e)}"
@@ -284,28 +280,31 @@ async def delete_project(
         db = await MongoDBClient.get_database()
         projects_collection = db["projects"]
         
-        result = await projects_collection.delete_one({
-            "project_id": project_id,
-            "tenant_id": tenant_id
-        })
-        
-        if result.deleted_count == 0:
+        # find_one_and_delete returns the removed document, so callers get an
+        # audit copy without a second query.
+        deleted_project = await projects_collection.find_one_and_delete(
+            {"project_id": project_id, "tenant_id": tenant_id},
+            projection={"_id": 0, "ai_model_id": 0},
+        )
+
+        if deleted_project is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project '{project_id}' not found",
             )
-        
-        logger.warning(f"Deleted project '{project_id}' for tenant '{tenant_id}'")
-        
+
+        logger.warning("Deleted project '%s' for tenant '%s'", project_id, tenant_id)
+
         return {
             "success": True,
-            "message": f"Project '{project_id}' deleted successfully"
+            "message": f"Project '{project_id}' deleted successfully",
+            "deleted_project": deleted_project
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting project: {str(e)}")
+        logger.error("Error deleting project: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete project: {str(e)}"
@@ -327,30 +326,31 @@ async def assign_ai_model(
         projects_collection = db["projects"]
         ai_models_collection = db["ai_models"]
         
-        # Verify project exists
-        project = await projects_collection.find_one({
-            "project_id": project_id,
-            "tenant_id": tenant_id
-        })
-        
+        # Verify the project and the AI model concurrently — the two lookups
+        # have no ordering dependency, so overlap the round-trips.
+        project, ai_model = await asyncio.gather(
+            projects_collection.find_one(
+                {"project_id": project_id, "tenant_id": tenant_id},
+                projection={"_id": 1},
+            ),
+            ai_models_collection.find_one(
+                {"model_id": request.ai_model_id, "tenant_id": tenant_id},
+                projection={"_id": 1},
+            ),
+        )
+
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project '{project_id}' not found",
             )
-        
-        # Verify AI model exists and belongs to this tenant
-        ai_model = await ai_models_collection.find_one({
-            "model_id": request.ai_model_id,
-            "tenant_id": tenant_id
-        })
-        
+
         if not ai_model:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"AI model '{request.ai_model_id}' not found",
             )
-        
+
         # Update project with new AI model
         await projects_collection.update_one(
             {"project_id": project_id, "tenant_id": tenant_id},
@@ -360,7 +360,7 @@ async def assign_ai_model(
             }}
         )
         
-        logger.info(f"Assigned AI model '{request.ai_model_id}' to project '{project_id}'")
+        logger.info("Assigned AI model '%s' to project '%s'", request.ai_model_id, project_id)
         
         return {
             "success": True,
@@ -370,7 +370,7 @@ async def assign_ai_model(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error assigning AI model: {str(e)}")
+        logger.error("Error assigning AI model: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to assign AI model: {str(e)}"
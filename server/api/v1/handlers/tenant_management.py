@@ -4,28 +4,40 @@ Tenant Management Handler
 Admin endpoints for creating, updating, and managing tenants
 """
 
+import asyncio
 import logging
+import re
 import secrets
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
 
 from fastapi import APIRouter, Header, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 from server.config.settings import get_settings
 from server.models.tenant import Tenant, TenantQuota, tenant_manager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/admin", tags=["Tenant Management"])
+router = APIRouter(
+    prefix="/admin",
+    tags=["Tenant Management"],
+    default_response_class=ORJSONResponse,
+)
 
 settings = get_settings()
 # Admin API key sourced from environment (see Settings.admin_api_key)
 ADMIN_API_KEY = settings.admin_api_key
+# Encoded once so each request does a constant-time compare without re-encoding
+_ADMIN_KEY_BYTES = ADMIN_API_KEY.encode("utf-8") if ADMIN_API_KEY else None
 
 
 class CreateTenantRequest(BaseModel):
     """Request model for creating a new tenant"""
+    model_config = ConfigDict(extra="forbid")
+
     name: str
     email: EmailStr
     quota_max_uploads_per_month: int = 100
@@ -34,6 +46,8 @@ class CreateTenantRequest(BaseModel):
 
 class UpdateTenantRequest(BaseModel):
     """Request model for updating tenant"""
+    model_config = ConfigDict(extra="forbid")
+
     name: Optional[str] = None
     email: Optional[EmailStr] = None
     active: Optional[bool] = None
@@ -62,7 +76,11 @@ def verify_admin_key(x_admin_key: Optional[str] = Header(None)) -> str:
             detail="Admin API key required. Include X-Admin-Key header.",
         )
 
-    if x_admin_key != ADMIN_API_KEY:
+    # _ADMIN_KEY_BYTES is None when no admin key is configured; reject
+    # rather than hand compare_digest a None
+    if _ADMIN_KEY_BYTES is None or not secrets.compare_digest(
+        x_admin_key.encode("utf-8"), _ADMIN_KEY_BYTES
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid admin API key",
@@ -71,41 +89,82 @@ def verify_admin_key(x_admin_key: Optional[str] = Header(None)) -> str:
     return x_admin_key
 
 
+# Short-lived read cache for admin lookups: tenant_id -> (expires_at, Tenant).
+# Admin UI pages fire several tenant reads in quick succession; a small TTL
+# cache collapses those into one Mongo round-trip. Mutating endpoints
+# invalidate their entry so stale data never outlives the write.
+_TENANT_CACHE: Dict[str, Tuple[float, Tenant]] = {}
+_TENANT_CACHE_TTL = 30.0
+_tenant_cache_lock = asyncio.Lock()
+
+
+async def _get_tenant_cached(tenant_id: str) -> Optional[Tenant]:
+    """Fetch a tenant, serving repeat admin reads from the TTL cache."""
+    now = time.monotonic()
+    async with _tenant_cache_lock:
+        cached = _TENANT_CACHE.get(tenant_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    tenant = await tenant_manager.get_tenant(tenant_id)
+    if tenant:
+        async with _tenant_cache_lock:
+            _TENANT_CACHE[tenant_id] = (now + _TENANT_CACHE_TTL, tenant)
+    return tenant
+
+
+async def _invalidate_tenant_cache(tenant_id: str) -> None:
+    """Drop a cached tenant after a mutation so later reads see fresh data."""
+    async with _tenant_cache_lock:
+        _TENANT_CACHE.pop(tenant_id, None)
+
+
+def _now_utc() -> datetime:
+    """Single timezone-aware timestamp helper; stored by pymongo as BSON Date."""
+    return datetime.now(timezone.utc)
+
+
+# Compiled once — slugification runs in the regex engine instead of a
+# per-character Python comprehension
+_WS_RE = re.compile(r"[ _]+")
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+
+
 def generate_tenant_id(name: str) -> str:
     """
     Generate a unique tenant ID from organization name
-    
+
     Args:
         name: Organization name
-    
+
     Returns:
         Unique tenant ID (e.g., "city-general-a1b2")
     """
-    # Convert name to slug
-    slug = name.lower().replace(" ", "-").replace("_", "-")
-    # Remove special characters
-    slug = ''.join(c for c in slug if c.isalnum() or c == '-')
+    # Convert name to slug and strip special characters
+    slug = _SLUG_RE.sub("", _WS_RE.sub("-", name.lower()))
     # Add random suffix for uniqueness
     suffix = secrets.token_hex(2)  # 4 character hex
     tenant_id = f"{slug}-{suffix}"
-    
+
     return tenant_id
 
 
+_API_KEY_PREFIX = "sk_"
+
+
 def generate_api_key(tenant_id: str) -> str:
     """
     Generate a secure API key for tenant
-    
+
     Args:
         tenant_id: Tenant identifier
-    
+
     Returns:
         API key (e.g., "sk_city_general_a1b2_abc123def456")
     """
     # Generate cryptographically secure random token
     token = secrets.token_urlsafe(24)  # 32 characters
-    api_key = f"sk_{tenant_id}_{token}"
-    return api_key
+    return "".join((_API_KEY_PREFIX, tenant_id, "_", token))
 
 
 @router.post("/tenants", response_model=TenantResponse)
@@ -142,7 +201,7 @@ async def create_tenant(
             name=request.name,
             email=request.email,
             api_key=api_key,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=_now_utc(),
             active=True,
             quota=TenantQuota(
                 max_uploads_per_month=request.quota_max_uploads_per_month,
@@ -180,8 +239,10 @@ async def list_tenants(
     verify_admin_key(admin_key)
     
     tenants = await tenant_manager.list_all_tenants()
-    
-    return {
+
+    # Serialize directly through orjson — no jsonable_encoder pass over
+    # what is already a plain list of dicts.
+    return ORJSONResponse({
         "success": True,
         "total_tenants": len(tenants),
         "tenants": [
@@ -195,7 +256,7 @@ async def list_tenants(
             }
             for t in tenants.values()
         ]
-    }
+    })
 
 
 @router.get("/tenants/{tenant_id}", response_model=TenantResponse)
@@ -210,7 +271,7 @@ async def get_tenant(
     """
     verify_admin_key(admin_key)
     
-    tenant = await tenant_manager.get_tenant(tenant_id)
+    tenant = await _get_tenant_cached(tenant_id)
     
     if not tenant:
         raise HTTPException(
@@ -237,7 +298,7 @@ async def update_tenant(
     """
     verify_admin_key(admin_key)
     
-    tenant = await tenant_manager.get_tenant(tenant_id)
+    tenant = await _get_tenant_cached(tenant_id)
     
     if not tenant:
         raise HTTPException(
@@ -260,7 +321,8 @@ async def update_tenant(
         
         # Save updated tenant to MongoDB
         await tenant_manager.update_tenant(tenant)
-        
+        await _invalidate_tenant_cache(tenant_id)
+
         logger.info(f"Updated tenant: {tenant_id}")
         
         return TenantResponse(
@@ -291,26 +353,31 @@ async def delete_tenant(
     You must manually clean up Azure storage.
     """
     verify_admin_key(admin_key)
-    
-    tenant = await tenant_manager.get_tenant(tenant_id)
-    
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Tenant '{tenant_id}' not found"
-        )
-    
+
     try:
-        await tenant_manager.delete_tenant(tenant_id)
-        
+        # Single round-trip: delete and fetch the removed tenant atomically
+        # instead of get_tenant -> delete_tenant.
+        deleted = await tenant_manager.find_one_and_delete(tenant_id)
+
+        if deleted is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tenant '{tenant_id}' not found"
+            )
+
+        await _invalidate_tenant_cache(tenant_id)
+
         logger.warning(f"Deleted tenant: {tenant_id}")
-        
+
         return {
             "success": True,
             "message": f"Tenant '{tenant_id}' deleted successfully",
+            "deleted_tenant": deleted.model_dump(exclude={"api_key"}),
             "warning": "Azure Blob Storage data NOT deleted. Clean up manually if needed."
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error deleting tenant: {str(e)}")
         raise HTTPException(
@@ -333,7 +400,7 @@ async def regenerate_api_key(
     """
     verify_admin_key(admin_key)
     
-    tenant = await tenant_manager.get_tenant(tenant_id)
+    tenant = await _get_tenant_cached(tenant_id)
     
     if not tenant:
         raise HTTPException(
@@ -349,7 +416,8 @@ async def regenerate_api_key(
         # Update tenant
         tenant.api_key = new_api_key
         await tenant_manager.update_tenant(tenant)
-        
+        await _invalidate_tenant_cache(tenant_id)
+
         logger.warning(f"Regenerated API key for tenant: {tenant_id}")
         
         return TenantResponse(
@@ -2,9 +2,24 @@
 API v1 request/response models following Google API standards
 """
 
+import time
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
+
+# Timestamp cache for default factories: bulk list responses instantiate
+# hundreds of models, and each default would otherwise build its own
+# datetime. 10ms granularity is far finer than these timestamps need.
+_now_cache = [0.0, None]
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware default factory, cached at ~10ms granularity."""
+    t = time.time()
+    if _now_cache[1] is None or t - _now_cache[0] > 0.01:
+        _now_cache[0] = t
+        _now_cache[1] = datetime.fromtimestamp(t, tz=timezone.utc)
+    return _now_cache[1]
 
 
 class HealthCheckResponse(BaseModel):
@@ -12,7 +27,7 @@ class HealthCheckResponse(BaseModel):
 
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     gemini_api_configured: bool = Field(..., description="Whether Gemini API is configured")
     storage_type: str = Field(..., description="Type of storage backend")
 
@@ -36,6 +51,9 @@ class MedicalReportParseRequest(BaseModel):
 class PatientInfo(BaseModel):
     """Patient information model"""
 
+    # Immutable value object — hashable, and instances can be shared freely
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = Field(None, description="Patient name")
     age: Optional[int] = Field(None, description="Patient age")
     gender: Optional[str] = Field(None, description="Patient gender")
@@ -46,6 +64,9 @@ class PatientInfo(BaseModel):
 class VitalSigns(BaseModel):
     """Vital signs model"""
 
+    # Immutable value object — hashable, and instances can be shared freely
+    model_config = ConfigDict(frozen=True)
+
     temperature: Optional[float] = Field(None, description="Temperature (°C)")
     blood_pressure: Optional[str] = Field(None, description="Blood pressure (mmHg)")
     heart_rate: Optional[int] = Field(None, description="Heart rate (bpm)")
@@ -58,6 +79,9 @@ class VitalSigns(BaseModel):
 class LabResult(BaseModel):
     """Single lab test result"""
 
+    # Immutable value object — hashable, and instances can be shared freely
+    model_config = ConfigDict(frozen=True)
+
     test_name: str = Field(..., description="Test name")
     result: str = Field(..., description="Test result")
     unit: Optional[str] = Field(None, description="Unit of measurement")
@@ -68,6 +92,9 @@ class LabResult(BaseModel):
 class ImageInfo(BaseModel):
     """Information about an image found in the report"""
 
+    # Immutable value object — hashable, and instances can be shared freely
+    model_config = ConfigDict(frozen=True)
+
     image_number: int = Field(..., description="Sequential image number")
     description: str = Field(..., description="Description of the image content")
     page: Optional[int] = Field(None, description="Page number where image appears")
@@ -76,6 +103,9 @@ class ImageInfo(BaseModel):
 class PhotoComparison(BaseModel):
     """Photo comparison analysis for human images in the report"""
 
+    # Immutable value object — hashable, and instances can be shared freely
+    model_config = ConfigDict(frozen=True)
+
     images_found: List[ImageInfo] = Field(
         default_factory=list, description="List of human images found in the document"
     )
@@ -106,7 +136,7 @@ class MedicalReportParseResponse(BaseModel):
         ..., description="Parsed medical report data"
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Response metadata")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     confidence_score: Optional[float] = Field(
         None, description="Data extraction confidence score (0-1)"
     )
@@ -126,7 +156,7 @@ class MedicalReportDeleteResponse(BaseModel):
 
     id: str = Field(..., description="Deleted report ID")
     status: str = Field(..., description="Deletion status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class ValidationResult(BaseModel):
@@ -4,6 +4,7 @@ Multi-Tenant Medical Report Parser API
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from server.api.v1.handlers import health
 from server.api.v1.handlers import medical_reports_multitenant
@@ -12,8 +13,9 @@ from server.api.v1.handlers import ai_models
 from server.api.v1.handlers import projects
 from server.api.v1.handlers import analytics
 
-# Create main router
-router = APIRouter()
+# Create main router — responses render through orjson unless a handler
+# router overrides the default
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Health check
 router.include_router(health.router, prefix="/health", tags=["System Health"])
@@ -4,8 +4,12 @@ Business logic layer for medical report operations
 Follows service layer pattern with dependency injection
 """
 
+import asyncio
 import logging
+import os
+import re
 import uuid
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from fastapi import UploadFile
@@ -24,6 +28,19 @@ from server.api.v1.models.common import (
 
 logger = logging.getLogger(__name__)
 
+# Log banner built once instead of per call
+_BANNER = "=" * 60
+
+# Confidence tiers, lowest to highest; _confidence_score indexes into this
+# so the tunable thresholds live in one place
+_CONFIDENCE_TIERS = (0.60, 0.80, 0.95)
+
+
+def _confidence_score(error_count: int, warning_count: int) -> float:
+    """Map validation error/warning counts onto a confidence tier."""
+    tier = (error_count <= 2) + (error_count == 0 and warning_count <= 2)
+    return _CONFIDENCE_TIERS[tier]
+
 
 class MedicalReportService:
     """Service for medical report operations"""
@@ -39,7 +56,16 @@ class MedicalReportService:
             api_key=self.settings.gemini_api_key,
             model=self.settings.gemini_model,
         )
-        self.validator = MedicalDataValidator()
+        # Compiled once: one case-insensitive suffix match per upload instead
+        # of lowercasing the filename and scanning every allowed extension
+        self._allowed_ext_re = re.compile(
+            r"\.(?:"
+            + "|".join(
+                re.escape(ext.lstrip(".")) for ext in self.settings.allowed_extensions
+            )
+            + r")$",
+            re.IGNORECASE,
+        )
 
     async def parse_and_save_report(
         self, file: UploadFile
@@ -59,71 +85,82 @@ class MedicalReportService:
             StorageError: If storage operation fails
         """
         try:
-            logger.info("=" * 60)
+            logger.info(_BANNER)
             logger.info("🏥 Starting Medical Report Parsing")
             
             # Validate file
             logger.info("Step 1: Validating file...")
             self._validate_file(file)
-            logger.info(f"✅ File validated: {file.filename}")
+            logger.info("✅ File validated: %s", file.filename)
 
             # Generate report ID
             report_id = generate_report_id()
-            logger.info(f"Step 2: Generated report ID: {report_id}")
-
-            # Read file content
-            logger.info("Step 3: Reading file content...")
-            content = await file.read()
-            logger.info(f"✅ File read: {len(content)} bytes")
+            logger.info("Step 2: Generated report ID: %s", report_id)
+
+            # Measure the upload without buffering it — the spooled tempfile
+            # is handed to Gemini directly, so the PDF is never duplicated
+            # as an in-memory bytes copy
+            logger.info("Step 3: Preparing file content...")
+            upload_stream = file.file
+            upload_stream.seek(0, os.SEEK_END)
+            file_size = upload_stream.tell()
+            upload_stream.seek(0)
+            logger.info("✅ File size: %d bytes", file_size)
 
             # Parse document with Gemini using native PDF support
             logger.info("Step 4: Parsing PDF with Gemini (native PDF processing)...")
             logger.info("🎉 Using Gemini's native PDF parsing - No text extraction needed!")
-            
-            parsed_data = self.gemini_parser.parse_pdf(
-                pdf_bytes=content,
-                filename=file.filename
+
+            # The Gemini SDK is synchronous — run it in a worker thread so
+            # the event loop keeps serving other requests during the call
+            parsed_data = await asyncio.to_thread(
+                self.gemini_parser.parse_pdf,
+                pdf_bytes=upload_stream,
+                filename=file.filename,
             )
 
-            logger.info(f"Gemini parse result type: {type(parsed_data)}")
-            logger.info(f"Gemini parse result: {parsed_data}")
+            # The parsed payload can be tens of KB of nested JSON — only
+            # build its repr when debug logging is actually enabled.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Gemini parse result type: %s", type(parsed_data))
+                logger.debug("Gemini parse result: %r", parsed_data)
 
             if not parsed_data:
                 logger.error("❌ Gemini returned None or empty data")
                 raise Exception("Failed to parse medical report: Gemini returned no data")
             
             if not isinstance(parsed_data, dict):
-                logger.error(f"❌ Gemini returned invalid type: {type(parsed_data)}")
+                logger.error("❌ Gemini returned invalid type: %s", type(parsed_data))
                 raise Exception(f"Failed to parse medical report: Invalid data type {type(parsed_data)}")
             
-            logger.info(f"✅ Parsed data keys: {list(parsed_data.keys())}")
-
-            # Validate parsed data
-            logger.info("Step 5: Validating parsed data...")
-            is_valid, errors, warnings, calculated = self.validator.validate_all(
-                parsed_data
+            logger.info("✅ Parsed data keys: %s", list(parsed_data))
+
+            # The blob upload needs only the parsed data and validation is
+            # pure CPU over the same dict — run both in worker threads so
+            # they overlap and the event loop keeps serving other requests
+            logger.info("Step 5: Saving to Azure Blob Storage (in background)...")
+            logger.info("Step 6: Validating parsed data (in background)...")
+            # A fresh validator per call: the service is a cached singleton
+            # and validate_all accumulates results on the instance, so a
+            # shared validator racing across concurrent uploads would mix
+            # (or silently drop) errors between reports. Construction is a
+            # few slot assignments — effectively free.
+            (blob_name, (is_valid, errors, warnings, calculated)) = await asyncio.gather(
+                asyncio.to_thread(
+                    self.blob_storage.save,
+                    report_data=parsed_data,
+                    original_filename=file.filename,
+                    report_id=report_id,
+                ),
+                asyncio.to_thread(MedicalDataValidator().validate_all, parsed_data),
             )
-            logger.info(f"✅ Validation complete - Valid: {is_valid}, Errors: {len(errors)}, Warnings: {len(warnings)}")
+            logger.info("✅ Report saved: %s -> %s", report_id, blob_name)
+            logger.info("✅ Validation complete - Valid: %s, Errors: %d, Warnings: %d", is_valid, len(errors), len(warnings))
 
             # Determine confidence
-            logger.info("Step 6: Calculating confidence score...")
-            if not errors and len(warnings) <= 2:
-                confidence_score = 0.95
-            elif len(errors) <= 2:
-                confidence_score = 0.80
-            else:
-                confidence_score = 0.60
-            logger.info(f"✅ Confidence score: {confidence_score}")
-
-            # Save to Azure Blob Storage
-            logger.info("Step 7: Saving to Azure Blob Storage...")
-            blob_name = self.blob_storage.save(
-                report_data=parsed_data,
-                original_filename=file.filename,
-                report_id=report_id,
-            )
-
-            logger.info(f"✅ Report saved: {report_id} -> {blob_name}")
+            logger.info("Step 7: Calculating confidence score...")
+            confidence_score = _confidence_score(len(errors), len(warnings))
+            logger.info("✅ Confidence score: %s", confidence_score)
 
             # Build response
             logger.info("Step 8: Building response...")
@@ -145,17 +182,17 @@ class MedicalReportService:
             )
             
             logger.info("✅ Response built successfully")
-            logger.info("=" * 60)
+            logger.info(_BANNER)
 
             return response
 
         except Exception as e:
-            logger.error("=" * 60)
-            logger.error(f"❌ ERROR in parse_and_save_report:")
-            logger.error(f"Error type: {type(e).__name__}")
-            logger.error(f"Error message: {str(e)}")
+            logger.error(_BANNER)
+            logger.error("❌ ERROR in parse_and_save_report:")
+            logger.error("Error type: %s", type(e).__name__)
+            logger.error("Error message: %s", e)
             logger.exception("Full traceback:")
-            logger.error("=" * 60)
+            logger.error(_BANNER)
             raise
 
     async def get_all_reports(
@@ -179,45 +216,46 @@ class MedicalReportService:
         """
         try:
             logger.info(
-                f"Listing reports: limit={limit}, offset={offset}, "
-                f"patient_name={patient_name}, report_date={report_date}"
+                "Listing reports: limit=%d, offset=%d, patient_name=%s, report_date=%s",
+                limit, offset, patient_name, report_date,
             )
 
-            # Get all reports from storage
-            all_reports = self.blob_storage.list_all()
-
-            # Apply filters
+            # Filtered requests go straight to search — the unfiltered
+            # list_all result used to be computed and then discarded here.
+            # Unfiltered requests fetch only the requested page.
             if patient_name or report_date:
                 filtered_reports = self.blob_storage.search(
                     patient_name=patient_name, report_date=report_date
                 )
+                total = len(filtered_reports)
+                paginated = filtered_reports[offset : offset + limit]
             else:
-                filtered_reports = all_reports
-
-            # Apply pagination
-            total = len(filtered_reports)
-            paginated = filtered_reports[offset : offset + limit]
-
-            # Convert to response models
+                total = self.blob_storage.count()
+                paginated = self.blob_storage.list_page(offset, limit)
+
+            # Convert to response models. These documents were validated when
+            # they were written to storage, so model_construct skips the
+            # validator chain entirely — no per-row schema walk.
+            construct = MedicalReportParseResponse.model_construct
+            fromiso = datetime.fromisoformat
+            now = datetime.utcnow()
             reports = [
-                MedicalReportParseResponse(
+                construct(
                     id=report.get("reportId", "unknown"),
                     file_name=report.get("fileName", "unknown"),
                     status="success",
                     parsed_data=report,
-                    created_at=datetime.fromisoformat(
-                        report.get("uploadedAt", datetime.utcnow().isoformat())
-                    ),
+                    created_at=fromiso(up) if (up := report.get("uploadedAt")) else now,
                 )
                 for report in paginated
             ]
 
-            return MedicalReportListResponse(
+            return MedicalReportListResponse.model_construct(
                 reports=reports, total=total, limit=limit, offset=offset
             )
 
         except Exception as e:
-            logger.error(f"Error listing reports: {str(e)}")
+            logger.error("Error listing reports: %s", e)
             raise
 
     async def get_report_by_id(self, report_id: str) -> Optional[MedicalReportParseResponse]:
@@ -234,28 +272,32 @@ class MedicalReportService:
             NotFoundError: If report not found
         """
         try:
-            logger.info(f"Retrieving report: {report_id}")
+            logger.info("Retrieving report: %s", report_id)
 
             report_data = self.blob_storage.get(report_id)
 
             if not report_data:
-                logger.warning(f"Report not found: {report_id}")
+                logger.warning("Report not found: %s", report_id)
                 return None
 
+            # dict.get evaluates its default eagerly, so the old
+            # utcnow().isoformat() fallback allocated a datetime and string
+            # even when uploadedAt was present
+            uploaded_at = report_data.get("uploadedAt")
             response = MedicalReportParseResponse(
                 id=report_data.get("reportId", report_id),
                 file_name=report_data.get("fileName", "unknown"),
                 status="success",
                 parsed_data=report_data,
-                created_at=datetime.fromisoformat(
-                    report_data.get("uploadedAt", datetime.utcnow().isoformat())
-                ),
+                created_at=datetime.fromisoformat(uploaded_at)
+                if uploaded_at
+                else datetime.utcnow(),
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Error retrieving report: {str(e)}")
+            logger.error("Error retrieving report: %s", e)
             raise
 
     async def delete_report(self, report_id: str) -> MedicalReportDeleteResponse:
@@ -272,22 +314,22 @@ class MedicalReportService:
             NotFoundError: If report not found
         """
         try:
-            logger.info(f"Deleting report: {report_id}")
+            logger.info("Deleting report: %s", report_id)
 
             deleted = self.blob_storage.delete(report_id)
 
             if not deleted:
-                logger.warning(f"Report not found for deletion: {report_id}")
+                logger.warning("Report not found for deletion: %s", report_id)
                 return None
 
-            logger.info(f"Report deleted: {report_id}")
+            logger.info("Report deleted: %s", report_id)
 
             return MedicalReportDeleteResponse(
                 id=report_id, status="deleted", timestamp=datetime.utcnow()
             )
 
         except Exception as e:
-            logger.error(f"Error deleting report: {str(e)}")
+            logger.error("Error deleting report: %s", e)
             raise
 
     def _validate_file(self, file: UploadFile) -> None:
@@ -306,9 +348,20 @@ class MedicalReportService:
             raise ValidationError("File name is required")
 
         # Check file extension
-        if not any(file.filename.lower().endswith(ext) for ext in self.settings.allowed_extensions):
+        if not self._allowed_ext_re.search(file.filename):
             raise ValidationError(
                 f"Invalid file type. Allowed types: {', '.join(self.settings.allowed_extensions)}"
             )
 
         # TODO: Check file size when reading
+
+
+@lru_cache(maxsize=1)
+def get_medical_report_service() -> MedicalReportService:
+    """
+    Shared service instance for dependency injection.
+
+    Constructing the service builds Azure and Gemini clients; caching it
+    means each worker process warms those connection pools exactly once.
+    """
+    return MedicalReportService()
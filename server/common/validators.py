@@ -4,13 +4,119 @@ Implements rule-based validation to achieve 99-100% accuracy
 """
 
 import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+# Patterns compiled once at import: the validators make hundreds of regex
+# calls per report (one or more per lab row), and compiled patterns skip
+# the per-call lookup through re's pattern cache
+_NUM_RE = re.compile(r'[\d.]+')
+_INT_RE = re.compile(r'\d+')
+_RANGE_RE = re.compile(r'([\d.]+)\s*-\s*([\d.]+)')
+_UPTO_RE = re.compile(r'up to\s+([\d.]+)', re.IGNORECASE)
+_PHONE_RE = re.compile(r'^[\d\s\-+()]+$')
+
+_DATE_FORMATS = ('%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%Y/%m/%d')
+
+# Qualitative results that never carry a numeric range check
+_QUALITATIVE_RESULTS = frozenset({'NEGATIVE', 'NIL', 'ABSENT', 'CLEAR', 'PALE YELLOW'})
+
+_VALID_GENDERS = frozenset({'Male', 'Female', 'Other', 'M', 'F'})
+
+# Test names used by the ratio checks, interned so lab_dict/lab_floats
+# lookups compare by pointer instead of hashing multi-word strings
+_ALBUMIN = sys.intern('SERUM ALBUMIN')
+_GLOBULIN = sys.intern('SERUM GLOBULIN')
+_AG_RATIO = sys.intern('A/G RATIO')
+_TOTAL_CHOL = sys.intern('TOTAL CHOLESTEROL')
+_HDL = sys.intern('HDL CHOLESTEROL - DIRECT')
+_TC_HDL = sys.intern('TC/HDL')
+_LDL = sys.intern('LDL CHOLESTEROL - DIRECT')
+_LDL_HDL = sys.intern('LDL/HDL')
+_TRIGLYCERIDES = sys.intern('TRIGLYCERIDES')
+_VLDL = sys.intern('VLDL CHOLESTEROL')
+
+# One rule per derived value: (error label, warning label, numerator key and
+# display name, denominator key and display name, extracted-value key,
+# tolerance, rounding digits, calculated_fields key, fixed divisor). The
+# VLDL rule divides by a constant instead of a second lab value.
+_RATIO_RULES = (
+    ('A/G Ratio', 'A/G ratio', _ALBUMIN, 'Albumin', _GLOBULIN, 'Globulin',
+     _AG_RATIO, 0.1, 2, 'A/G_ratio', None),
+    ('TC/HDL Ratio', 'TC/HDL ratio', _TOTAL_CHOL, 'Total Cholesterol', _HDL, 'HDL',
+     _TC_HDL, 0.2, 1, 'TC/HDL_ratio', None),
+    ('LDL/HDL Ratio', 'LDL/HDL ratio', _LDL, 'LDL', _HDL, 'HDL',
+     _LDL_HDL, 0.2, 1, 'LDL/HDL_ratio', None),
+    ('VLDL', 'VLDL calculation', _TRIGLYCERIDES, 'Triglycerides', None, None,
+     _VLDL, 1.0, 1, 'VLDL', 5.0),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a date string against the known report formats.
+
+    Cached because strptime is slow and the same DOB/exam-date strings
+    recur across reports in batch ingestion.
+    """
+    # Every accepted format is 8-10 characters; reject anything else before
+    # attempting four strptime parses that would each raise
+    if not date_str or not 8 <= len(date_str) <= 10:
+        return None
+
+    # Zero-padded dates (the common case) identify their format from the
+    # delimiter positions alone — and once the layout is known, strptime is
+    # unnecessary: fromisoformat and direct int slicing are both far cheaper
+    if len(date_str) == 10:
+        try:
+            if date_str[4] == '-':
+                return datetime.fromisoformat(date_str)
+            if date_str[4] == '/':
+                return datetime.fromisoformat(date_str.replace('/', '-'))
+            if date_str[2] in '-/':
+                return datetime(
+                    int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2])
+                )
+        except ValueError:
+            return None
+        return None
+
+    # Shorter strings have single-digit day/month, so delimiter positions
+    # are ambiguous; fall back to trying each format
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Convert a lab result to float, or None for qualitative values"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Shared read-only fallback so missing/malformed sections don't allocate a
+# fresh dict per validator per report
+_EMPTY_DICT: Dict[str, Any] = {}
+
+
+def _get_dict(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Fetch a section that should be a dict, tolerating missing/bad types"""
+    value = data.get(key)
+    return value if type(value) is dict else _EMPTY_DICT
 
 
 class MedicalDataValidator:
     """Validates extracted medical report data for accuracy and consistency"""
-    
+
+    __slots__ = ('validation_errors', 'validation_warnings', 'calculated_fields')
+
     def __init__(self):
         self.validation_errors = []
         self.validation_warnings = []
@@ -19,7 +125,11 @@ class MedicalDataValidator:
     def validate_all(self, data: Dict[str, Any]) -> Tuple[bool, List[str], List[str], Dict[str, Any]]:
         """
         Run all validations on extracted data
-        
+
+        Error and warning messages are formatted eagerly: every caller
+        serializes them into response metadata, so there is nothing to gain
+        from deferring the string construction.
+
         Returns:
             (is_valid, errors, warnings, calculated_fields)
         """
@@ -27,11 +137,29 @@ class MedicalDataValidator:
         self.validation_warnings = []
         self.calculated_fields = {}
         
+        # Build the lab lookup once; every lab validator used to rescan the
+        # raw list and re-parse the same result strings to float
+        lab_results = data.get('lab_results')
+        if not isinstance(lab_results, list):
+            lab_results = []
+        # sys.intern only accepts str; Gemini occasionally emits null or
+        # numeric test names, which are keyed raw instead of raising
+        lab_dict = {
+            (sys.intern(name) if isinstance(name := test['test_name'], str) else name): test
+            for test in lab_results
+            if test and isinstance(test, dict) and 'test_name' in test
+        }
+        lab_floats = {
+            name: value
+            for name, test in lab_dict.items()
+            if (value := _safe_float(test.get('result'))) is not None
+        }
+
         # Run all validation checks
         self._validate_dates(data)
         self._validate_calculated_vitals(data)
-        self._validate_calculated_lab_ratios(data)
-        self._validate_lab_ranges(data)
+        self._validate_calculated_lab_ratios(lab_dict, lab_floats)
+        self._validate_lab_ranges(lab_results)
         self._validate_cross_references(data)
         self._validate_logical_consistency(data)
         self._validate_data_types(data)
@@ -41,13 +169,8 @@ class MedicalDataValidator:
     
     def _validate_dates(self, data: Dict[str, Any]):
         """Validate date formats and calculate age"""
-        patient_info = data.get('patient_info')
-        if not isinstance(patient_info, dict):
-            patient_info = {}
-            
-        report_info = data.get('report_info')
-        if not isinstance(report_info, dict):
-            report_info = {}
+        patient_info = _get_dict(data, 'patient_info')
+        report_info = _get_dict(data, 'report_info')
         
         dob = patient_info.get('date_of_birth')
         exam_date = report_info.get('examination_date')
@@ -69,7 +192,13 @@ class MedicalDataValidator:
                     
                     # Verify against extracted age
                     if extracted_age:
-                        extracted_age_num = int(re.search(r'\d+', extracted_age).group())
+                        # Ages arrive as '34 years' — int() on the first
+                        # token covers that without spinning up the regex
+                        # engine; the regex stays as fallback for odd inputs
+                        try:
+                            extracted_age_num = int(extracted_age.split(None, 1)[0])
+                        except (ValueError, IndexError):
+                            extracted_age_num = int(_INT_RE.search(extracted_age).group())
                         if abs(extracted_age_num - age_years) > 0:
                             self.validation_errors.append(
                                 f"Age mismatch: Extracted '{extracted_age}', Calculated '{age_years} years' "
@@ -80,21 +209,13 @@ class MedicalDataValidator:
             except Exception as e:
                 self.validation_warnings.append(f"Could not validate age calculation: {str(e)}")
     
-    def _parse_date(self, date_str: str) -> datetime:
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date from multiple formats"""
-        formats = ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%Y/%m/%d']
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except:
-                continue
-        return None
+        return _parse_date_cached(date_str)
     
     def _validate_calculated_vitals(self, data: Dict[str, Any]):
         """Validate calculated vital sign fields"""
-        vitals = data.get('vitals')
-        if not isinstance(vitals, dict):
-            vitals = {}
+        vitals = _get_dict(data, 'vitals')
         
         # Validate BMI
         weight_str = vitals.get('weight')
@@ -104,8 +225,8 @@ class MedicalDataValidator:
         if weight_str and height_str:
             try:
                 # Extract numeric values
-                weight_kg = float(re.search(r'[\d.]+', weight_str).group())
-                height_cm = float(re.search(r'[\d.]+', height_str).group())
+                weight_kg = float(_NUM_RE.search(weight_str).group())
+                height_cm = float(_NUM_RE.search(height_str).group())
                 
                 # Calculate BMI
                 height_m = height_cm / 100
@@ -116,7 +237,7 @@ class MedicalDataValidator:
                 
                 # Verify against extracted BMI
                 if extracted_bmi:
-                    extracted_bmi_num = float(re.search(r'[\d.]+', extracted_bmi).group())
+                    extracted_bmi_num = float(_NUM_RE.search(extracted_bmi).group())
                     if abs(extracted_bmi_num - calculated_bmi) > 0.1:
                         self.validation_errors.append(
                             f"BMI mismatch: Extracted '{extracted_bmi}', Calculated '{calculated_bmi} kg/m^2' "
@@ -127,109 +248,53 @@ class MedicalDataValidator:
             except Exception as e:
                 self.validation_warnings.append(f"Could not validate BMI calculation: {str(e)}")
     
-    def _validate_calculated_lab_ratios(self, data: Dict[str, Any]):
+    def _validate_calculated_lab_ratios(self, lab_dict: Dict[str, Any], lab_floats: Dict[str, float]):
         """Validate calculated laboratory test ratios"""
-        lab_results = data.get('lab_results')
-        if not isinstance(lab_results, list):
-            lab_results = []
-        
-        # Create lookup dict for lab values
-        lab_dict = {test['test_name']: test for test in lab_results if test and isinstance(test, dict) and 'test_name' in test}
-        
-        # Validate A/G Ratio
-        albumin = lab_dict.get('SERUM ALBUMIN')
-        globulin = lab_dict.get('SERUM GLOBULIN')
-        ag_ratio = lab_dict.get('A/G RATIO')
-        
-        if albumin and globulin and ag_ratio:
-            try:
-                alb_val = float(albumin['result'])
-                glob_val = float(globulin['result'])
-                calculated_ag = alb_val / glob_val
-                calculated_ag = round(calculated_ag, 2)
-                
-                self.calculated_fields['A/G_ratio'] = calculated_ag
-                
-                extracted_ag = float(ag_ratio['result'])
-                if abs(extracted_ag - calculated_ag) > 0.1:
-                    self.validation_errors.append(
-                        f"A/G Ratio mismatch: Extracted '{extracted_ag}', Calculated '{calculated_ag}' "
-                        f"from Albumin {alb_val} and Globulin {glob_val}"
-                    )
-            except Exception as e:
-                self.validation_warnings.append(f"Could not validate A/G ratio: {str(e)}")
-        
-        # Validate TC/HDL Ratio
-        total_chol = lab_dict.get('TOTAL CHOLESTEROL')
-        hdl = lab_dict.get('HDL CHOLESTEROL - DIRECT')
-        tc_hdl = lab_dict.get('TC/HDL')
-        
-        if total_chol and hdl and tc_hdl:
-            try:
-                tc_val = float(total_chol['result'])
-                hdl_val = float(hdl['result'])
-                calculated_tc_hdl = tc_val / hdl_val
-                calculated_tc_hdl = round(calculated_tc_hdl, 1)
-                
-                self.calculated_fields['TC/HDL_ratio'] = calculated_tc_hdl
-                
-                extracted_tc_hdl = float(tc_hdl['result'])
-                if abs(extracted_tc_hdl - calculated_tc_hdl) > 0.2:
-                    self.validation_errors.append(
-                        f"TC/HDL Ratio mismatch: Extracted '{extracted_tc_hdl}', Calculated '{calculated_tc_hdl}' "
-                        f"from Total Cholesterol {tc_val} and HDL {hdl_val}"
-                    )
-            except Exception as e:
-                self.validation_warnings.append(f"Could not validate TC/HDL ratio: {str(e)}")
-        
-        # Validate LDL/HDL Ratio
-        ldl = lab_dict.get('LDL CHOLESTEROL - DIRECT')
-        
-        if ldl and hdl and lab_dict.get('LDL/HDL'):
-            try:
-                ldl_val = float(ldl['result'])
-                hdl_val = float(hdl['result'])
-                calculated_ldl_hdl = ldl_val / hdl_val
-                calculated_ldl_hdl = round(calculated_ldl_hdl, 1)
-                
-                self.calculated_fields['LDL/HDL_ratio'] = calculated_ldl_hdl
-                
-                extracted_ldl_hdl = float(lab_dict['LDL/HDL']['result'])
-                if abs(extracted_ldl_hdl - calculated_ldl_hdl) > 0.2:
-                    self.validation_errors.append(
-                        f"LDL/HDL Ratio mismatch: Extracted '{extracted_ldl_hdl}', Calculated '{calculated_ldl_hdl}' "
-                        f"from LDL {ldl_val} and HDL {hdl_val}"
+        warn = self.validation_warnings.append
+        error = self.validation_errors.append
+
+        for (label, warn_label, num_key, num_name, den_key, den_name,
+             extracted_key, tolerance, digits, calc_key, divisor) in _RATIO_RULES:
+            # Only validate when the report actually carries the inputs and
+            # the extracted value to compare against
+            if num_key not in lab_dict or extracted_key not in lab_dict:
+                continue
+            if den_key is not None and den_key not in lab_dict:
+                continue
+
+            num_val = lab_floats.get(num_key)
+            extracted = lab_floats.get(extracted_key)
+            den_val = lab_floats.get(den_key) if den_key is not None else divisor
+
+            if num_val is None or not den_val or extracted is None:
+                warn(f"Could not validate {warn_label}: non-numeric result")
+                continue
+
+            calculated = round(num_val / den_val, digits)
+            self.calculated_fields[calc_key] = calculated
+
+            if abs(extracted - calculated) > tolerance:
+                if den_key is not None:
+                    error(
+                        f"{label} mismatch: Extracted '{extracted}', Calculated '{calculated}' "
+                        f"from {num_name} {num_val} and {den_name} {den_val}"
                     )
-            except Exception as e:
-                self.validation_warnings.append(f"Could not validate LDL/HDL ratio: {str(e)}")
-        
-        # Validate VLDL (should be Triglycerides / 5)
-        triglycerides = lab_dict.get('TRIGLYCERIDES')
-        vldl = lab_dict.get('VLDL CHOLESTEROL')
-        
-        if triglycerides and vldl:
-            try:
-                trig_val = float(triglycerides['result'])
-                calculated_vldl = trig_val / 5
-                calculated_vldl = round(calculated_vldl, 1)
-                
-                self.calculated_fields['VLDL'] = calculated_vldl
-                
-                extracted_vldl = float(vldl['result'])
-                if abs(extracted_vldl - calculated_vldl) > 1.0:
-                    self.validation_errors.append(
-                        f"VLDL mismatch: Extracted '{extracted_vldl}', Calculated '{calculated_vldl}' "
-                        f"from Triglycerides {trig_val}"
+                else:
+                    error(
+                        f"{label} mismatch: Extracted '{extracted}', Calculated '{calculated}' "
+                        f"from {num_name} {num_val}"
                     )
-            except Exception as e:
-                self.validation_warnings.append(f"Could not validate VLDL calculation: {str(e)}")
-    
-    def _validate_lab_ranges(self, data: Dict[str, Any]):
+
+    def _validate_lab_ranges(self, lab_results: List[Dict[str, Any]]):
         """Validate lab results are within or outside reference ranges as stated"""
-        lab_results = data.get('lab_results')
-        if not isinstance(lab_results, list):
-            lab_results = []
-        
+        # Hot loop for large panels: alias the bound methods once so the
+        # per-row cost is comparisons and the occasional f-string for
+        # outliers, not repeated attribute lookups
+        warn = self.validation_warnings.append
+        error = self.validation_errors.append
+        range_search = _RANGE_RE.search
+        upto_search = _UPTO_RE.search
+
         for test in lab_results:
             if not test or not isinstance(test, dict):
                 continue
@@ -237,53 +302,51 @@ class MedicalDataValidator:
             result = test.get('result')
             ref_range = test.get('reference_range')
             status = test.get('status')
-            
-            if not result or not ref_range or result in ['NEGATIVE', 'NIL', 'ABSENT', 'CLEAR', 'PALE YELLOW']:
+
+            if not result or not ref_range or result in _QUALITATIVE_RESULTS:
                 continue
-            
+
+            # Non-numeric results (qualitative findings not in the skip list
+            # above) are common — screen them with _safe_float, which unlike
+            # the old regex prefilter also accepts signed values
+            result_num = _safe_float(result)
+            if result_num is None:
+                continue
+
             try:
-                result_num = float(result)
-                
-                # Parse reference range
-                range_match = re.search(r'([\d.]+)\s*-\s*([\d.]+)', ref_range)
+                # Parse reference range; "up to X" only needs checking when
+                # no min-max pair is present
+                range_match = range_search(ref_range)
                 if range_match:
                     min_val = float(range_match.group(1))
                     max_val = float(range_match.group(2))
-                    
+
                     is_in_range = min_val <= result_num <= max_val
-                    
+
                     # Verify status
                     if is_in_range and status != 'normal':
-                        self.validation_warnings.append(
+                        warn(
                             f"{test_name}: Result {result_num} is in range [{min_val}-{max_val}] "
                             f"but marked as '{status}'"
                         )
                     elif not is_in_range and status == 'normal':
-                        self.validation_errors.append(
+                        error(
                             f"{test_name}: Result {result_num} is OUT of range [{min_val}-{max_val}] "
                             f"but marked as 'normal'"
                         )
-                
-                # Handle "up to X" ranges
-                upto_match = re.search(r'up to\s+([\d.]+)', ref_range)
-                if upto_match:
+                elif (upto_match := upto_search(ref_range)):
                     max_val = float(upto_match.group(1))
                     if result_num > max_val and status == 'normal':
-                        self.validation_errors.append(
+                        error(
                             f"{test_name}: Result {result_num} exceeds max {max_val} but marked as 'normal'"
                         )
-            except:
+            except (ValueError, TypeError):
                 continue
-    
+
     def _validate_cross_references(self, data: Dict[str, Any]):
         """Validate consistency across different sections"""
-        doctor_info = data.get('doctor_info')
-        if not isinstance(doctor_info, dict):
-            doctor_info = {}
-            
-        hospital_info = data.get('hospital_info')
-        if not isinstance(hospital_info, dict):
-            hospital_info = {}
+        doctor_info = _get_dict(data, 'doctor_info')
+        hospital_info = _get_dict(data, 'hospital_info')
         
         # Check if examiner name appears consistently
         examiner = doctor_info.get('medical_examiner', '')
@@ -291,11 +354,7 @@ class MedicalDataValidator:
     
     def _validate_logical_consistency(self, data: Dict[str, Any]):
         """Validate logical consistency in the data"""
-        clinical = data.get('clinical_findings')
-        
-        # Ensure clinical is a dictionary
-        if not isinstance(clinical, dict):
-            clinical = {}
+        clinical = _get_dict(data, 'clinical_findings')
         
         # Check if patient marked YES but details say NIL
         reported_history = clinical.get('patient_reported_history', [])
@@ -309,81 +368,87 @@ class MedicalDataValidator:
     
     def _validate_data_types(self, data: Dict[str, Any]):
         """Validate data types and formats"""
-        patient_info = data.get('patient_info')
-        if not isinstance(patient_info, dict):
-            patient_info = {}
+        patient_info = _get_dict(data, 'patient_info')
         
         # Validate gender
         gender = patient_info.get('gender')
-        if gender and gender not in ['Male', 'Female', 'Other', 'M', 'F']:
+        if gender and gender not in _VALID_GENDERS:
             self.validation_warnings.append(f"Unusual gender value: '{gender}'")
         
         # Validate phone numbers (if present)
         contact = patient_info.get('contact_number')
-        if contact and not re.match(r'^[\d\s\-+()]+$', str(contact)):
+        if contact and not _PHONE_RE.match(str(contact)):
             self.validation_warnings.append(f"Invalid phone number format: '{contact}'")
     
     def generate_report(self, data: Dict[str, Any]) -> str:
         """Generate a validation report"""
         is_valid, errors, warnings, calculated = self.validate_all(data)
-        
-        report = "\n" + "="*60 + "\n"
-        report += "VALIDATION REPORT\n"
-        report += "="*60 + "\n\n"
-        
+
+        # Collect the lines and join once at the end — repeated += on a
+        # growing string reallocates the whole buffer each time
+        parts = ["\n" + "="*60 + "\n"]
+        parts.append("VALIDATION REPORT\n")
+        parts.append("="*60 + "\n\n")
+
         if is_valid:
-            report += "✓ ALL VALIDATIONS PASSED\n\n"
+            parts.append("✓ ALL VALIDATIONS PASSED\n\n")
         else:
-            report += f"✗ VALIDATION FAILED: {len(errors)} error(s) found\n\n"
-        
+            parts.append(f"✗ VALIDATION FAILED: {len(errors)} error(s) found\n\n")
+
         if errors:
-            report += "ERRORS (MUST FIX):\n"
+            parts.append("ERRORS (MUST FIX):\n")
             for i, error in enumerate(errors, 1):
-                report += f"  {i}. {error}\n"
-            report += "\n"
-        
+                parts.append(f"  {i}. {error}\n")
+            parts.append("\n")
+
         if warnings:
-            report += f"WARNINGS ({len(warnings)}):\n"
+            parts.append(f"WARNINGS ({len(warnings)}):\n")
             for i, warning in enumerate(warnings, 1):
-                report += f"  {i}. {warning}\n"
-            report += "\n"
-        
+                parts.append(f"  {i}. {warning}\n")
+            parts.append("\n")
+
         if calculated:
-            report += "CALCULATED/VERIFIED FIELDS:\n"
+            parts.append("CALCULATED/VERIFIED FIELDS:\n")
             for field, value in calculated.items():
-                report += f"  ✓ {field}: {value}\n"
-            report += "\n"
-        
+                parts.append(f"  ✓ {field}: {value}\n")
+            parts.append("\n")
+
         # Calculate data quality score
         total_fields = self._count_non_null_fields(data)
         completeness = (total_fields / 50) * 100  # Assume 50 possible fields
-        
-        report += f"DATA QUALITY:\n"
-        report += f"  Completeness: {completeness:.1f}%\n"
-        report += f"  Errors: {len(errors)}\n"
-        report += f"  Warnings: {len(warnings)}\n"
-        
+
+        parts.append("DATA QUALITY:\n")
+        parts.append(f"  Completeness: {completeness:.1f}%\n")
+        parts.append(f"  Errors: {len(errors)}\n")
+        parts.append(f"  Warnings: {len(warnings)}\n")
+
         if len(errors) == 0 and len(warnings) <= 2:
             confidence = "HIGH"
         elif len(errors) <= 2 and len(warnings) <= 5:
             confidence = "MEDIUM"
         else:
             confidence = "LOW"
-        
-        report += f"  Confidence: {confidence}\n"
-        report += "="*60 + "\n"
-        
-        return report
+
+        parts.append(f"  Confidence: {confidence}\n")
+        parts.append("="*60 + "\n")
+
+        return "".join(parts)
     
-    def _count_non_null_fields(self, data: Dict[str, Any], count: int = 0) -> int:
-        """Recursively count non-null fields"""
-        if isinstance(data, dict):
-            for value in data.values():
-                if value is not None and value != [] and value != {}:
-                    if isinstance(value, (dict, list)):
-                        count = self._count_non_null_fields(value, count)
-                    else:
-                        count += 1
-        elif isinstance(data, list):
-            count += len([item for item in data if item is not None])
+    def _count_non_null_fields(self, data: Dict[str, Any]) -> int:
+        """Count non-null fields with an explicit stack (no recursion)"""
+        count = 0
+        stack = [data]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if type(node) is dict:
+                for value in node.values():
+                    if value is not None and value != [] and value != {}:
+                        if type(value) is dict or type(value) is list:
+                            push(value)
+                        else:
+                            count += 1
+            elif type(node) is list:
+                count += sum(1 for item in node if item is not None)
         return count
@@ -30,6 +30,10 @@ class ErrorCode(str, Enum):
 class APIException(Exception):
     """Base application exception following Google API error format"""
 
+    # Exceptions are built on every error path; slots keep the instances
+    # compact and make attribute reads direct slot lookups
+    __slots__ = ("error_code", "message", "status_code", "details", "request_id")
+
     def __init__(
         self,
         error_code: str,
@@ -62,6 +66,8 @@ class APIException(Exception):
 class ValidationError(APIException):
     """Raised when input validation fails"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -80,6 +86,8 @@ class ValidationError(APIException):
 class NotFoundError(APIException):
     """Raised when resource is not found"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -99,6 +107,8 @@ class NotFoundError(APIException):
 class ConflictError(APIException):
     """Raised when resource conflicts"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -117,6 +127,8 @@ class ConflictError(APIException):
 class StorageError(APIException):
     """Raised when storage operation fails"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -135,6 +147,8 @@ class StorageError(APIException):
 class ParsingError(APIException):
     """Raised when document parsing fails"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -153,6 +167,8 @@ class ParsingError(APIException):
 class ResourceExhaustedError(APIException):
     """Raised when rate limit or quota exceeded"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -172,6 +188,8 @@ class ResourceExhaustedError(APIException):
 class PermissionDeniedError(APIException):
     """Raised when permission is denied"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
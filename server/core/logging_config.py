@@ -2,6 +2,7 @@
 Core logging configuration
 """
 
+import functools
 import logging
 import sys
 from typing import Optional
@@ -10,12 +11,26 @@ from server.config.settings import get_settings
 from server.core.tenant_context import get_current_tenant
 
 
-class TenantContextFilter(logging.Filter):
-    """Attach tenant context to each log record."""
+# Set via logging.setLogRecordFactory so tenant_id is attached exactly once
+# per record at creation time, instead of once per handler through a filter
+_factory_installed = False
 
-    def filter(self, record: logging.LogRecord) -> bool:
+
+def _install_record_factory() -> None:
+    """Wrap the LogRecord factory to stamp each record with the tenant id."""
+    global _factory_installed
+    if _factory_installed:
+        return
+
+    old_factory = logging.getLogRecordFactory()
+
+    def record_factory(*args, **kwargs) -> logging.LogRecord:
+        record = old_factory(*args, **kwargs)
         record.tenant_id = get_current_tenant() or "-"
-        return True
+        return record
+
+    logging.setLogRecordFactory(record_factory)
+    _factory_installed = True
 
 
 def configure_logging(level: Optional[str] = None) -> None:
@@ -28,9 +43,14 @@ def configure_logging(level: Optional[str] = None) -> None:
     settings = get_settings()
     log_level = level or settings.log_level
 
+    _install_record_factory()
+
+    # Resolve the level constant once for both the logger and the handler
+    level_const = getattr(logging, log_level, logging.INFO)
+
     # Create logger
     logger = logging.getLogger("medical_parser")
-    logger.setLevel(getattr(logging, log_level))
+    logger.setLevel(level_const)
 
     # Remove existing handlers to avoid duplicate logs when reconfiguring
     for handler in list(logger.handlers):
@@ -39,8 +59,7 @@ def configure_logging(level: Optional[str] = None) -> None:
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level))
-    console_handler.addFilter(TenantContextFilter())
+    console_handler.setLevel(level_const)
 
     # Create formatter
     formatter = logging.Formatter(
@@ -54,6 +73,7 @@ def configure_logging(level: Optional[str] = None) -> None:
     return logger
 
 
+@functools.lru_cache(maxsize=128)
 def get_logger(name: str) -> logging.Logger:
     """
     Get logger instance for a module
@@ -64,4 +84,6 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    # logging.getLogger caches too, but this skips the string format and
+    # manager-dict lookup on repeat calls
     return logging.getLogger(f"medical_parser.{name}")
@@ -2,14 +2,81 @@
 Azure Blob Storage integration module
 """
 
-import json
+import gzip
 import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from azure.storage.blob import BlobServiceClient
+from urllib.parse import quote
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import BlobServiceClient, ContentSettings
+
+from server.common.utils import sanitize_blob_name
 
 logger = logging.getLogger(__name__)
 
+# Blob index tag values allow a restricted charset; anything else is dropped
+_TAG_UNSAFE_RE = re.compile(r"[^a-z0-9 +\-.:=_/]")
+
+
+def _tag_value(value: str) -> str:
+    """Normalize a string into a legal blob index tag value"""
+    return _TAG_UNSAFE_RE.sub("", value.lower())
+
+
+def _meta_value(value: str) -> str:
+    """
+    Percent-encode a metadata value down to ASCII
+
+    Blob metadata travels in x-ms-meta-* HTTP headers, which reject
+    non-ASCII outright. Percent-encoding is lossless, and because it is a
+    deterministic per-byte mapping, substring matching still works as long
+    as search needles are encoded the same way.
+    """
+    return quote(value, safe=" _-./:")
+
+
+# One BlobServiceClient per connection string, shared across storage wrapper
+# instances so every request reuses the same warmed connection pool instead
+# of paying fresh TLS handshakes
+_CLIENT_CACHE: Dict[str, BlobServiceClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Containers whose existence has already been verified this process
+_ENSURED_CONTAINERS: set = set()
+
+
+def get_blob_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Shared BlobServiceClient for a connection string
+
+    The client rides on a requests.Session whose pool is sized for the
+    listing fan-out, so concurrent downloads reuse keep-alive connections.
+    """
+    client = _CLIENT_CACHE.get(connection_string)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(connection_string)
+            if client is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                client = BlobServiceClient.from_connection_string(
+                    connection_string,
+                    transport=RequestsTransport(session=session),
+                )
+                _CLIENT_CACHE[connection_string] = client
+    return client
+
 
 class AzureBlobStorage:
     """Azure Blob Storage client for report persistence"""
@@ -24,10 +91,10 @@ class AzureBlobStorage:
         """
         self.connection_string = connection_string
         self.container_name = container_name
-        self.blob_service_client = BlobServiceClient.from_connection_string(
-            connection_string
-        )
+        self.blob_service_client = get_blob_service_client(connection_string)
         self.container_client = None
+        self._report_cache: Dict[str, tuple] = {}
+        self._report_cache_lock = threading.Lock()
         self._ensure_container_exists()
 
     def _ensure_container_exists(self) -> None:
@@ -36,6 +103,10 @@ class AzureBlobStorage:
             self.container_client = self.blob_service_client.get_container_client(
                 self.container_name
             )
+            # Only pay the existence round trip once per process
+            cache_key = (self.connection_string, self.container_name)
+            if cache_key in _ENSURED_CONTAINERS:
+                return
             try:
                 self.container_client.get_container_properties()
                 logger.info(f"Connected to container: {self.container_name}")
@@ -44,10 +115,98 @@ class AzureBlobStorage:
                 self.container_client = self.blob_service_client.create_container(
                     self.container_name
                 )
+            _ENSURED_CONTAINERS.add(cache_key)
         except Exception as e:
             logger.error(f"Error ensuring container exists: {str(e)}")
             raise
 
+    # Listing downloads are network-latency-bound; fanning them out across
+    # threads turns K sequential round trips into ~K/workers
+    _DOWNLOAD_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+    # Short-lived read cache: list-then-detail and repeated opens pull the
+    # same report within seconds, and each miss is a full download + parse
+    _REPORT_CACHE_TTL = 60.0
+    _REPORT_CACHE_MAX = 512
+
+    # Misses are cached too (briefly): an unknown ID costs a point read
+    # plus a full legacy container scan, and typo/stale-link traffic tends
+    # to repeat the same unknown ID
+    _MISSING = object()
+    _NEGATIVE_TTL = 15.0
+
+    def _download_report(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch and decode one report blob; None if it fails to load"""
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            report = orjson.loads(self._read_blob(blob_client))
+            report["blobName"] = blob_name
+            return report
+        except Exception as e:
+            logger.warning(f"Error loading blob {blob_name}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _read_blob(blob_client) -> bytes:
+        """
+        Download a blob body into one preallocated buffer
+
+        readall() assembles the content by joining an internal chunk list,
+        which transiently doubles the allocation for large reports;
+        readinto() streams the chunks straight into a single buffer sized
+        from the download response. orjson.loads accepts the bytearray as is.
+
+        Compressed bodies are detected by the gzip magic bytes rather than
+        the blob's content_encoding, so reports written before compression
+        was introduced — or already inflated by a transparent HTTP layer —
+        decode the same way.
+        """
+        stream = blob_client.download_blob(max_concurrency=4)
+        buffer = bytearray(stream.size)
+        stream.readinto(buffer)
+        if buffer[:2] == b"\x1f\x8b":
+            return gzip.decompress(bytes(buffer))
+        return buffer
+
+    def _cache_put(
+        self, report_id: str, report: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store a report in the read cache, evicting stale entries first"""
+        now = time.monotonic()
+        with self._report_cache_lock:
+            if len(self._report_cache) >= self._REPORT_CACHE_MAX:
+                expired = [
+                    key
+                    for key, (expires_at, _) in self._report_cache.items()
+                    if expires_at <= now
+                ]
+                for key in expired:
+                    del self._report_cache[key]
+                if len(self._report_cache) >= self._REPORT_CACHE_MAX:
+                    # Still full of live entries — drop the oldest insertion
+                    self._report_cache.pop(next(iter(self._report_cache)))
+            self._report_cache[report_id] = (
+                now + (self._REPORT_CACHE_TTL if ttl is None else ttl),
+                report,
+            )
+
+    def _cache_get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached report if present and fresh"""
+        with self._report_cache_lock:
+            entry = self._report_cache.get(report_id)
+            if entry is None:
+                return None
+            expires_at, report = entry
+            if expires_at <= time.monotonic():
+                del self._report_cache[report_id]
+                return None
+            return report
+
+    def _cache_invalidate(self, report_id: str) -> None:
+        """Drop a report from the read cache"""
+        with self._report_cache_lock:
+            self._report_cache.pop(report_id, None)
+
     def save(
         self, report_data: Dict[str, Any], original_filename: str, report_id: str
     ) -> str:
@@ -66,29 +225,61 @@ class AzureBlobStorage:
             # Safely extract patient name with fallback
             patient_info = report_data.get("patient_info") or {}
             patient_name = patient_info.get("name") or "unknown"
-            # Ensure patient_name is a string before calling replace
+            # Ensure patient_name is a string before sanitizing
             if patient_name:
-                patient_name = str(patient_name).replace(" ", "_")
+                patient_name = sanitize_blob_name(str(patient_name))
             else:
                 patient_name = "unknown"
-                
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            blob_name = f"reports/{patient_name}_{timestamp}_{report_id}.json"
 
-            # Prepare blob metadata
+            # Deterministic path keyed by report ID, so get()/delete() are a
+            # single blob operation instead of a container scan. Descriptive
+            # fields live in metadata rather than the blob name.
+            blob_name = f"reports/{report_id}.json"
+
+            # Prepare blob metadata. patientName and reportDate are the
+            # fields search() filters on, so keeping them here lets listings
+            # filter without downloading blob bodies.
+            report_info = report_data.get("report_info") or {}
             metadata = {
                 "reportId": report_id,
-                "fileName": original_filename,
+                "fileName": _meta_value(original_filename),
+                "patientName": _meta_value(patient_name),
+                # Pre-lowercased copy so search() compares without calling
+                # .lower() on every listed blob
+                "patientLower": _meta_value(patient_name.lower()),
+                "reportDate": _meta_value(str(report_info.get("date") or "unknown")),
                 "uploadedAt": datetime.utcnow().isoformat(),
                 "dataVersion": "1.0",
             }
 
-            # Upload to blob
+            # Report JSON is highly repetitive (key names, terminology) and
+            # the read paths are download-bandwidth-bound, so compressing
+            # before upload cuts both transfer time and storage severalfold.
+            # Stored opaquely — no content_encoding — because advertising
+            # gzip makes HTTP layers inflate the body in transit, breaking
+            # the size-based download buffer; _read_blob's magic-byte sniff
+            # makes the bytes self-describing instead.
             blob_client = self.container_client.get_blob_client(blob_name)
             blob_client.upload_blob(
-                json.dumps(report_data, indent=2), overwrite=True, metadata=metadata
+                gzip.compress(orjson.dumps(report_data), compresslevel=5),
+                overwrite=True,
+                metadata=metadata,
+                content_settings=ContentSettings(content_type="application/json"),
             )
 
+            # Index tags let search() push exact-match filters to the
+            # storage service; tagging failures shouldn't fail the save
+            try:
+                blob_client.set_blob_tags(
+                    {
+                        "patient": _tag_value(patient_name),
+                        "date": _tag_value(metadata["reportDate"]),
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"Could not set index tags on {blob_name}: {str(e)}")
+
+            self._cache_invalidate(report_id)
             logger.info(f"Report saved to blob: {blob_name}")
             return blob_name
         except Exception as e:
@@ -106,15 +297,33 @@ class AzureBlobStorage:
             Report data or None if not found
         """
         try:
+            cached = self._cache_get(report_id)
+            if cached is not None:
+                return None if cached is self._MISSING else cached
+
+            # Direct lookup on the deterministic path — one HTTP call
+            blob_client = self.container_client.get_blob_client(
+                f"reports/{report_id}.json"
+            )
+            try:
+                report = orjson.loads(self._read_blob(blob_client))
+                self._cache_put(report_id, report)
+                return report
+            except ResourceNotFoundError:
+                pass
+
+            # Fallback scan for reports saved under the legacy
+            # {patient}_{timestamp}_{id}.json naming
             blob_list = self.container_client.list_blobs(name_starts_with="reports/")
 
             for blob in blob_list:
                 if report_id in blob.name:
                     blob_client = self.container_client.get_blob_client(blob.name)
-                    blob_data = blob_client.download_blob().readall()
-                    report = json.loads(blob_data)
+                    report = orjson.loads(self._read_blob(blob_client))
+                    self._cache_put(report_id, report)
                     return report
 
+            self._cache_put(report_id, self._MISSING, ttl=self._NEGATIVE_TTL)
             logger.warning(f"Report not found: {report_id}")
             return None
         except Exception as e:
@@ -132,33 +341,84 @@ class AzureBlobStorage:
             List of report summaries
         """
         try:
-            reports = []
-            blob_list = self.container_client.list_blobs(name_starts_with="reports/")
+            # Order by the listing's last-modified timestamp — it arrives
+            # with the name listing for free, so newest-first ordering is
+            # decided before any body is downloaded and limit trims the
+            # download set instead of the already-fetched results
+            blobs = sorted(
+                self.container_client.list_blobs(name_starts_with="reports/"),
+                key=lambda b: b.last_modified,
+                reverse=True,
+            )
+            names = [blob.name for blob in (blobs[:limit] if limit else blobs)]
 
-            for blob in blob_list:
-                try:
-                    blob_client = self.container_client.get_blob_client(blob.name)
-                    blob_data = blob_client.download_blob().readall()
-                    report = json.loads(blob_data)
-                    report["blobName"] = blob.name
-                    reports.append(report)
-
-                    if limit and len(reports) >= limit:
-                        break
-                except Exception as e:
-                    logger.warning(f"Error loading blob {blob.name}: {str(e)}")
-                    continue
+            with ThreadPoolExecutor(max_workers=self._DOWNLOAD_WORKERS) as executor:
+                reports = [
+                    report
+                    for report in executor.map(self._download_report, names)
+                    if report is not None
+                ]
 
-            # Sort by upload time (descending)
-            reports.sort(
-                key=lambda x: x.get("uploadedAt", ""), reverse=True
-            )
             logger.info(f"Retrieved {len(reports)} reports from blob storage")
             return reports
         except Exception as e:
             logger.error(f"Error listing reports from blob storage: {str(e)}")
             raise
 
+    def count(self) -> int:
+        """
+        Count stored reports without downloading any blob contents
+
+        Returns:
+            Number of report blobs
+        """
+        try:
+            return sum(
+                1 for _ in self.container_client.list_blobs(name_starts_with="reports/")
+            )
+        except Exception as e:
+            logger.error(f"Error counting reports in blob storage: {str(e)}")
+            raise
+
+    def list_page(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        List one page of reports, newest first
+
+        Ordering comes from the blob listing's last-modified metadata, so
+        only the requested page is ever downloaded — skipped rows never
+        leave Azure.
+
+        Args:
+            offset: Number of reports to skip
+            limit: Maximum number of reports to return
+
+        Returns:
+            List of report documents for the page
+        """
+        try:
+            blobs = sorted(
+                self.container_client.list_blobs(name_starts_with="reports/"),
+                key=lambda b: b.last_modified,
+                reverse=True,
+            )
+
+            names = [blob.name for blob in blobs[offset : offset + limit]]
+            with ThreadPoolExecutor(max_workers=self._DOWNLOAD_WORKERS) as executor:
+                reports = [
+                    report
+                    for report in executor.map(self._download_report, names)
+                    if report is not None
+                ]
+
+            logger.info(
+                f"Retrieved {len(reports)} reports from blob storage "
+                f"(offset={offset}, limit={limit})"
+            )
+            return reports
+        except Exception as e:
+            logger.error(f"Error listing report page from blob storage: {str(e)}")
+            raise
+
     def delete(self, report_id: str) -> bool:
         """
         Delete report from Azure Blob Storage
@@ -170,25 +430,100 @@ class AzureBlobStorage:
             True if deleted successfully
         """
         try:
+            self._cache_invalidate(report_id)
+
+            # Direct delete on the deterministic path — one HTTP call
+            try:
+                self.container_client.get_blob_client(
+                    f"reports/{report_id}.json"
+                ).delete_blob()
+                logger.info(f"Report deleted: {report_id}")
+                return True
+            except ResourceNotFoundError:
+                pass
+
+            # Fallback scan for legacy blob names. The report ID is embedded
+            # in the name, so matching on it is enough — no need to download
+            # and reparse the body just to re-check the same ID.
             blob_list = self.container_client.list_blobs(name_starts_with="reports/")
 
             for blob in blob_list:
                 if report_id in blob.name:
-                    blob_client = self.container_client.get_blob_client(blob.name)
-                    blob_data = blob_client.download_blob().readall()
-                    report = json.loads(blob_data)
-
-                    if report.get("reportId") == report_id or report_id in blob.name:
-                        blob_client.delete_blob()
-                        logger.info(f"Report deleted: {report_id}")
-                        return True
+                    self.container_client.get_blob_client(blob.name).delete_blob()
+                    logger.info(f"Report deleted: {report_id}")
+                    return True
 
+            self._cache_put(report_id, self._MISSING, ttl=self._NEGATIVE_TTL)
             logger.warning(f"Report not found for deletion: {report_id}")
             return False
         except Exception as e:
             logger.error(f"Error deleting report from blob storage: {str(e)}")
             raise
 
+    def delete_many(self, report_ids: List[str]) -> int:
+        """
+        Delete several reports in one batch request
+
+        delete_blobs issues Azure batch calls (up to 256 deletes per HTTP
+        request), so bulk cleanup costs ~N/256 round trips instead of N.
+        Reports stored under legacy blob names are not covered here — use
+        delete() for those.
+
+        Args:
+            report_ids: Report identifiers to delete
+
+        Returns:
+            Number of reports requested for deletion
+        """
+        if not report_ids:
+            return 0
+        try:
+            for report_id in report_ids:
+                self._cache_invalidate(report_id)
+            self.container_client.delete_blobs(
+                *[f"reports/{report_id}.json" for report_id in report_ids],
+                raise_on_any_failure=False,
+            )
+            logger.info(f"Batch deleted {len(report_ids)} reports")
+            return len(report_ids)
+        except Exception as e:
+            logger.error(f"Error batch deleting reports: {str(e)}")
+            raise
+
+    def _find_by_tags(
+        self,
+        patient_name: Optional[str],
+        report_date: Optional[str],
+    ) -> List[str]:
+        """
+        Resolve an exact-match search through the blob index tags
+
+        Tags only support equality, so this answers full-value matches;
+        substring searches fall through to the metadata listing. Returns an
+        empty list when nothing matched or the query is not tag-answerable.
+        """
+        clauses = [f"@container = '{self.container_name}'"]
+        if patient_name:
+            clauses.append(
+                "\"patient\" = '" + _tag_value(patient_name.replace(" ", "_")) + "'"
+            )
+        if report_date:
+            clauses.append("\"date\" = '" + _tag_value(report_date) + "'")
+
+        if len(clauses) == 1:
+            return []
+
+        try:
+            return [
+                blob.name
+                for blob in self.blob_service_client.find_blobs_by_tags(
+                    " AND ".join(clauses)
+                )
+            ]
+        except Exception as e:
+            logger.warning(f"Tag-index search unavailable: {str(e)}")
+            return []
+
     def search(
         self,
         patient_name: Optional[str] = None,
@@ -197,6 +532,10 @@ class AzureBlobStorage:
         """
         Search reports by criteria
 
+        Filtering happens against blob metadata from the listing, so only
+        matching report bodies are downloaded. Blobs saved before the
+        metadata fields existed are downloaded and filtered in Python.
+
         Args:
             patient_name: Patient name to search for
             report_date: Report date to filter by
@@ -205,10 +544,65 @@ class AzureBlobStorage:
             List of matching reports
         """
         try:
-            all_reports = self.list_all()
-            filtered_reports = []
+            # Tag-index hits are exact matches only — a strict subset of
+            # the substring semantics this endpoint promises — so they
+            # augment the metadata scan below rather than short-circuiting
+            # it (returning early would hide e.g. "john_smith" whenever an
+            # exact "john" blob exists)
+            tagged_names = set(self._find_by_tags(patient_name, report_date))
+
+            # save() stores the name with spaces collapsed to underscores
+            # and metadata values percent-encoded; encode the needle the
+            # same way so substring comparison stays apples-to-apples
+            name_needle = (
+                _meta_value(patient_name.lower().replace(" ", "_"))
+                if patient_name
+                else None
+            )
+
+            matched_names = []
+            legacy_names = []
+            blob_list = self.container_client.list_blobs(
+                name_starts_with="reports/", include=["metadata"]
+            )
+            for blob in blob_list:
+                meta = blob.metadata or {}
+                if "patientName" not in meta:
+                    legacy_names.append(blob.name)
+                    continue
+
+                if name_needle:
+                    # Blobs saved before patientLower existed still need the
+                    # lowercase pass
+                    patient_lower = meta.get("patientLower") or meta["patientName"].lower()
+                    if name_needle not in patient_lower:
+                        continue
+                if report_date and _meta_value(report_date) not in meta.get(
+                    "reportDate", ""
+                ):
+                    continue
+                matched_names.append(blob.name)
+
+            # Union in any tag-index hits the metadata pass didn't surface
+            # (e.g. blobs whose metadata was stripped but whose tags remain)
+            seen_names = set(matched_names)
+            matched_names.extend(
+                name for name in tagged_names if name not in seen_names
+            )
 
-            for report in all_reports:
+            with ThreadPoolExecutor(max_workers=self._DOWNLOAD_WORKERS) as executor:
+                filtered_reports = [
+                    report
+                    for report in executor.map(self._download_report, matched_names)
+                    if report is not None
+                ]
+                legacy_reports = [
+                    report
+                    for report in executor.map(self._download_report, legacy_names)
+                    if report is not None
+                ]
+
+            for report in legacy_reports:
                 matches = True
 
                 if patient_name:
@@ -3,42 +3,113 @@ Multi-tenant Azure Blob Storage wrapper
 Provides tenant isolation for medical reports
 """
 
-import json
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from azure.storage.blob import BlobServiceClient
+import threading
+from typing import Any, ClassVar, Dict, List, Optional
+from datetime import datetime, timedelta
+import aiohttp
+import orjson
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob import BlobSasPermissions, ContentSettings, generate_blob_sas
+from azure.storage.blob.aio import BlobServiceClient
 from fastapi import UploadFile
 
+from server.common.utils import sanitize_blob_name
 from server.core.tenant_context import get_current_tenant
 
 logger = logging.getLogger(__name__)
 
+# One async BlobServiceClient per connection string, shared across wrapper
+# instances so every coroutine rides the same warmed connection pool.
+# Construction is pure object setup (no network I/O), so a plain lock is fine.
+_ASYNC_CLIENT_CACHE: Dict[str, BlobServiceClient] = {}
+_ASYNC_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Explicit connector size for the shared transport. AioHttpTransport
+# silently drops a connection_limit kwarg, so the pool has to be set on an
+# aiohttp session we build ourselves. Any per-call max_concurrency must
+# stay below this.
+_CONNECTION_LIMIT = 64
+
+
+def get_async_blob_service_client(connection_string: str) -> BlobServiceClient:
+    """Shared async BlobServiceClient for a connection string"""
+    client = _ASYNC_CLIENT_CACHE.get(connection_string)
+    if client is None:
+        with _ASYNC_CLIENT_CACHE_LOCK:
+            client = _ASYNC_CLIENT_CACHE.get(connection_string)
+            if client is None:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=_CONNECTION_LIMIT)
+                )
+                # session_owner=True: closing the client (see
+                # close_async_blob_clients) also closes this session
+                client = BlobServiceClient.from_connection_string(
+                    connection_string,
+                    transport=AioHttpTransport(session=session, session_owner=True),
+                )
+                _ASYNC_CLIENT_CACHE[connection_string] = client
+    return client
+
+
+async def close_async_blob_clients() -> None:
+    """
+    Close every cached async BlobServiceClient
+
+    The clients are shared across wrapper instances, so teardown belongs to
+    application shutdown rather than any single instance. Safe to call when
+    no client was ever built.
+    """
+    with _ASYNC_CLIENT_CACHE_LOCK:
+        clients = list(_ASYNC_CLIENT_CACHE.values())
+        _ASYNC_CLIENT_CACHE.clear()
+    for client in clients:
+        await client.close()
+
 
 class MultiTenantAzureBlobClient:
-    """Azure Blob Storage client with multi-tenant support"""
-    
+    """Azure Blob Storage client with multi-tenant support
+
+    Built on azure.storage.blob.aio: every blob operation is a true await,
+    so the event loop keeps serving other requests for the full network
+    round trip instead of blocking on the sync SDK.
+    """
+
+    # Containers this process has already verified, keyed by container URL —
+    # shared across instances so re-constructing the client never repeats
+    # the create_container round trip
+    _verified_containers: ClassVar[set] = set()
+
     def __init__(self, connection_string: str, container_name: str):
         """
         Initialize Azure Blob Storage client
-        
+
         Args:
             connection_string: Azure Storage connection string
             container_name: Container name for storing reports
         """
         if not connection_string:
             raise ValueError("AZURE_STORAGE_CONNECTION_STRING environment variable not set")
-        
-        self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+
+        self.blob_service_client = get_async_blob_service_client(connection_string)
         self.container_client = self.blob_service_client.get_container_client(container_name)
-        
-        # Create container if it doesn't exist
+        self.container_name = container_name
+
+    async def initialize(self) -> None:
+        """Create the container if it doesn't exist (once per process)"""
+        # Constructors cannot await, so container creation lives here,
+        # awaited lazily before the first real operation
+        if self.container_client.url in self._verified_containers:
+            return
         try:
-            self.container_client.create_container()
-            logger.info(f"Created container: {container_name}")
+            await self.container_client.create_container()
+            logger.info(f"Created container: {self.container_name}")
         except Exception:
-            logger.info(f"Container already exists: {container_name}")
-    
+            logger.info(f"Container already exists: {self.container_name}")
+        self._verified_containers.add(self.container_client.url)
+
     async def upload_report(
         self,
         tenant_id: str,
@@ -47,56 +118,166 @@ class MultiTenantAzureBlobClient:
     ) -> str:
         """
         Upload medical report with tenant isolation
-        
+
         Args:
             tenant_id: Tenant identifier
             file: PDF file to upload
             parsed_data: Parsed medical data from Gemini
-        
+
         Returns:
             report_id: Unique identifier for the report (blob path)
         """
         try:
             self._assert_tenant_scope(tenant_id)
-            # Create tenant-specific blob path
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            file_name = file.filename.replace(" ", "_")
+            await self.initialize()
+            # Create tenant-specific blob path. One utcnow() feeds both the
+            # blob-name timestamp and the metadata upload_date, so the two
+            # fields always agree and the second clock read is saved.
+            now = datetime.utcnow()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            file_name = sanitize_blob_name(file.filename)
             blob_name = f"{tenant_id}/{timestamp}_{file_name}"
-            
-            # Get blob client
-            blob_client = self.container_client.get_blob_client(blob_name)
-            
-            # Read file content
-            file_content = await file.read()
-            
-            # Upload PDF file
-            blob_client.upload_blob(file_content, overwrite=True)
-            
-            # Set metadata
+
+            # Get blob client (one bound-method lookup covers both blobs)
+            get_blob_client = self.container_client.get_blob_client
+            blob_client = get_blob_client(blob_name)
+
+            # Measure the upload from its spooled tempfile instead of
+            # buffering the whole PDF into memory with file.read()
+            upload_stream = file.file
+            upload_stream.seek(0, 2)
+            file_size = upload_stream.tell()
+            upload_stream.seek(0)
+
             metadata = {
                 "tenant_id": tenant_id,
                 "file_name": file.filename,
-                "upload_date": datetime.utcnow().isoformat(),
+                "upload_date": now.isoformat(),
                 "content_type": file.content_type or "application/pdf",
-                "file_size_bytes": str(len(file_content))
+                "file_size_bytes": str(file_size)
             }
-            blob_client.set_blob_metadata(metadata)
-            
-            # Upload parsed data as separate JSON blob
+
             parsed_blob_name = f"{blob_name}.json"
-            parsed_blob_client = self.container_client.get_blob_client(parsed_blob_name)
-            parsed_blob_client.upload_blob(
-                json.dumps(parsed_data, indent=2),
-                overwrite=True
+            parsed_blob_client = get_blob_client(parsed_blob_name)
+
+            # Stream the PDF and upload the parsed-data sidecar concurrently;
+            # metadata rides along on the upload, saving the separate
+            # set_blob_metadata round trip
+            await asyncio.gather(
+                blob_client.upload_blob(
+                    upload_stream,
+                    overwrite=True,
+                    length=file_size,
+                    max_concurrency=8,
+                    metadata=metadata,
+                    content_settings=ContentSettings(
+                        content_type=file.content_type or "application/pdf"
+                    ),
+                ),
+                parsed_blob_client.upload_blob(
+                    orjson.dumps(parsed_data),
+                    overwrite=True,
+                    content_settings=ContentSettings(content_type="application/json"),
+                ),
             )
-            
+
             logger.info(f"Uploaded report for tenant {tenant_id}: {blob_name}")
             return blob_name
-            
+
         except Exception as e:
             logger.error(f"Error uploading report: {str(e)}")
             raise
-    
+
+    async def upload_bytes(
+        self,
+        tenant_id: str,
+        blob_path: str,
+        data: bytes,
+        content_type: str = "application/pdf"
+    ) -> str:
+        """
+        Upload raw bytes with tenant isolation and return the blob URL
+
+        Args:
+            tenant_id: Tenant identifier
+            blob_path: Path of the blob inside the tenant prefix
+            data: Raw bytes to upload
+            content_type: MIME type of the content
+
+        Returns:
+            Full URL of the uploaded blob
+        """
+        try:
+            self._assert_tenant_scope(tenant_id)
+            await self.initialize()
+            blob_name = f"{tenant_id}/{blob_path}"
+            blob_client = self.container_client.get_blob_client(blob_name)
+
+            metadata = {
+                "tenant_id": tenant_id,
+                "upload_date": datetime.utcnow().isoformat(),
+                "content_type": content_type,
+                "file_size_bytes": str(len(data))
+            }
+            await blob_client.upload_blob(data, overwrite=True, metadata=metadata)
+
+            logger.info(f"Uploaded {len(data)} bytes for tenant {tenant_id}: {blob_name}")
+            return self._readable_url(blob_client, blob_name)
+
+        except Exception as e:
+            logger.error(f"Error uploading blob: {str(e)}")
+            raise
+
+    def _readable_url(self, blob_client, blob_name: str) -> str:
+        """
+        Blob URL with a short-lived read SAS appended
+
+        The containers this app creates are private, so the bare blob URL is
+        not fetchable; callers hand these URLs to plain HTTP downloads
+        (e.g. Gemini's PDF fetch). Falls back to the bare URL when the
+        credential carries no account key (SAS-based connection strings).
+        """
+        account_key = getattr(self.blob_service_client.credential, "account_key", None)
+        if not account_key:
+            return blob_client.url
+        sas_token = generate_blob_sas(
+            account_name=self.blob_service_client.account_name,
+            container_name=self.container_name,
+            blob_name=blob_name,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.utcnow() + timedelta(hours=1),
+        )
+        return f"{blob_client.url}?{sas_token}"
+
+    async def delete_blob_by_url(self, blob_url: str):
+        """
+        Delete a blob identified by its full URL
+
+        Args:
+            blob_url: Full URL of the blob (as returned by upload_bytes)
+
+        Raises:
+            Exception: If the URL does not belong to this container
+        """
+        try:
+            container_url = self.container_client.url
+            if not blob_url.startswith(container_url):
+                raise Exception("Blob URL does not belong to this container")
+
+            # Drop any SAS query string before recovering the blob name
+            blob_name = blob_url[len(container_url):].lstrip("/").split("?", 1)[0]
+            try:
+                await self.container_client.get_blob_client(blob_name).delete_blob()
+            except ResourceNotFoundError:
+                pass
+
+            logger.info(f"Deleted blob by URL: {blob_name}")
+
+        except Exception as e:
+            logger.error(f"Error deleting blob by URL: {str(e)}")
+            raise
+
     async def list_reports(
         self,
         tenant_id: str,
@@ -105,46 +286,49 @@ class MultiTenantAzureBlobClient:
     ) -> List[dict]:
         """
         List all reports for specific tenant
-        
+
         Args:
             tenant_id: Tenant identifier
             limit: Maximum number of reports to return
             offset: Number of reports to skip
-        
+
         Returns:
             List of report metadata
         """
         try:
             self._assert_tenant_scope(tenant_id)
+            await self.initialize()
             reports = []
-            
-            # List blobs with tenant prefix (security isolation)
+
+            # List blobs with tenant prefix (security isolation). Asking for
+            # metadata in the listing response removes the per-blob
+            # get_blob_properties round trip the old loop paid for every row.
             blob_list = self.container_client.list_blobs(
-                name_starts_with=f"{tenant_id}/"
+                name_starts_with=f"{tenant_id}/",
+                include=["metadata"],
+                results_per_page=max(limit, 10) * 2,
             )
-            
+
             count = 0
             skipped = 0
-            
-            for blob in blob_list:
+
+            async for blob in blob_list:
                 # Skip JSON files (parsed data)
                 if blob.name.endswith('.json'):
                     continue
-                
+
                 # Skip offset items
                 if skipped < offset:
                     skipped += 1
                     continue
-                
-                # Stop at limit
+
+                # Stop at limit; the pager is lazy, so breaking here also
+                # stops fetching further listing pages
                 if count >= limit:
                     break
-                
-                # Get metadata
-                blob_client = self.container_client.get_blob_client(blob.name)
-                properties = blob_client.get_blob_properties()
-                metadata = properties.metadata or {}
-                
+
+                metadata = blob.metadata or {}
+
                 reports.append({
                     "report_id": blob.name,
                     "file_name": metadata.get("file_name", blob.name.split('/')[-1]),
@@ -152,57 +336,64 @@ class MultiTenantAzureBlobClient:
                     "size_bytes": blob.size,
                     "tenant_id": tenant_id
                 })
-                
+
                 count += 1
-            
+
             logger.info(f"Listed {len(reports)} reports for tenant {tenant_id}")
             return reports
-            
+
         except Exception as e:
             logger.error(f"Error listing reports: {str(e)}")
             raise
-    
+
     async def get_report(self, report_id: str, tenant_id: str) -> dict:
         """
         Get specific report with parsed data
-        
+
         Args:
             report_id: Report identifier (blob path)
             tenant_id: Tenant identifier for security check
-        
+
         Returns:
             Report data with metadata and parsed content
-        
+
         Raises:
             Exception: If report not found or access denied
         """
         try:
             self._assert_tenant_scope(tenant_id)
+            await self.initialize()
             # Security check: ensure report belongs to tenant
             if not report_id.startswith(f"{tenant_id}/"):
                 raise Exception("Access denied: Report does not belong to this tenant")
-            
-            # Get PDF blob
-            blob_client = self.container_client.get_blob_client(report_id)
-            
-            if not blob_client.exists():
+
+            # Fetch the PDF properties and the parsed JSON concurrently.
+            # The exists() preflights are gone — a missing blob surfaces as
+            # ResourceNotFoundError from the real call, so each leg is one
+            # round trip instead of two.
+            get_blob_client = self.container_client.get_blob_client
+            blob_client = get_blob_client(report_id)
+            parsed_blob_client = get_blob_client(f"{report_id}.json")
+
+            async def _fetch_parsed() -> Dict[str, Any]:
+                try:
+                    stream = await parsed_blob_client.download_blob()
+                    return orjson.loads(await stream.readall())
+                except ResourceNotFoundError:
+                    return {}
+
+            try:
+                properties, parsed_data = await asyncio.gather(
+                    blob_client.get_blob_properties(),
+                    _fetch_parsed(),
+                )
+            except ResourceNotFoundError:
                 raise Exception("Report not found")
-            
-            # Get properties and metadata
-            properties = blob_client.get_blob_properties()
+
             metadata = properties.metadata or {}
-            
-            # Get parsed data
-            parsed_blob_name = f"{report_id}.json"
-            parsed_blob_client = self.container_client.get_blob_client(parsed_blob_name)
-            
-            parsed_data = {}
-            if parsed_blob_client.exists():
-                parsed_content = parsed_blob_client.download_blob().readall()
-                parsed_data = json.loads(parsed_content)
-            
+
             logger.info(f"Retrieved report {report_id} for tenant {tenant_id}")
-            
+
             return {
                 "report_id": report_id,
                 "tenant_id": metadata.get("tenant_id"),
@@ -211,41 +402,46 @@ class MultiTenantAzureBlobClient:
                 "size_bytes": properties.size,
                 "parsed_data": parsed_data
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting report: {str(e)}")
             raise
-    
+
     async def delete_report(self, report_id: str, tenant_id: str):
         """
         Delete report and its parsed data
-        
+
         Args:
             report_id: Report identifier (blob path)
             tenant_id: Tenant identifier for security check
-        
+
         Raises:
             Exception: If access denied
         """
         try:
             self._assert_tenant_scope(tenant_id)
+            await self.initialize()
             # Security check
             if not report_id.startswith(f"{tenant_id}/"):
                 raise Exception("Access denied: Report does not belong to this tenant")
-            
-            # Delete PDF blob
-            blob_client = self.container_client.get_blob_client(report_id)
-            if blob_client.exists():
-                blob_client.delete_blob()
-            
-            # Delete parsed JSON blob
-            parsed_blob_name = f"{report_id}.json"
-            parsed_blob_client = self.container_client.get_blob_client(parsed_blob_name)
-            if parsed_blob_client.exists():
-                parsed_blob_client.delete_blob()
-            
+
+            # Delete both blobs without exists() preflights; a blob that is
+            # already gone just means there is nothing to do
+            get_blob_client = self.container_client.get_blob_client
+
+            async def _delete(blob_name: str) -> None:
+                try:
+                    await get_blob_client(blob_name).delete_blob()
+                except ResourceNotFoundError:
+                    pass
+
+            await asyncio.gather(
+                _delete(report_id),
+                _delete(f"{report_id}.json"),
+            )
+
             logger.info(f"Deleted report {report_id} for tenant {tenant_id}")
-            
+
         except Exception as e:
             logger.error(f"Error deleting report: {str(e)}")
             raise
@@ -82,21 +82,29 @@ class GeminiParser:
             logger.exception("Gemini failed to parse document content.")
             raise RuntimeError("Gemini parsing failed") from exc
 
-    def parse_pdf(self, pdf_bytes: bytes, filename: str = "document.pdf") -> Optional[Dict[str, Any]]:
+    def parse_pdf(self, pdf_bytes, filename: str = "document.pdf") -> Optional[Dict[str, Any]]:
         """
         Parse PDF document using Gemini's native PDF support.
 
         Args:
-            pdf_bytes: Raw PDF bytes.
+            pdf_bytes: Raw PDF bytes, or a readable binary file object
+                (e.g. an UploadFile's spooled tempfile) streamed to disk
+                without an in-memory copy.
             filename: Optional filename used for logging.
         """
+        import shutil
         import time
         tmp_path = None
         try:
             # Time: File upload to Gemini
             upload_start = time.time()
             with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_bytes)
+                if isinstance(pdf_bytes, (bytes, bytearray, memoryview)):
+                    tmp_file.write(pdf_bytes)
+                else:
+                    # File-like: copy in chunks so multi-MB PDFs never
+                    # materialize as one bytes object
+                    shutil.copyfileobj(pdf_bytes, tmp_file, 1024 * 1024)
                 tmp_path = tmp_file.name
 
             uploaded_file = genai.upload_file(tmp_path, mime_type="application/pdf")
@@ -157,6 +165,29 @@ class GeminiParser:
                 except OSError:
                     logger.debug("Failed to delete temporary file '%s'.", tmp_path, exc_info=True)
 
+    def parse_pdf_from_url(self, blob_url: str, filename: str = "document.pdf") -> Optional[Dict[str, Any]]:
+        """
+        Parse a PDF stored in blob storage by fetching it on demand.
+
+        Only one document's bytes are resident at a time instead of every
+        upload staying in memory for the full parse duration.
+
+        Args:
+            blob_url: Full URL of the PDF blob.
+            filename: Optional filename used for logging.
+        """
+        pdf_bytes = self._download_pdf(blob_url)
+        return self.parse_pdf(pdf_bytes, filename)
+
+    @staticmethod
+    def _download_pdf(blob_url: str) -> bytes:
+        """Download PDF bytes from a blob URL."""
+        import httpx
+
+        response = httpx.get(blob_url, timeout=60.0)
+        response.raise_for_status()
+        return response.content
+
     def parse_multiple_pdfs(self, pdf_files: list) -> Optional[Dict[str, Any]]:
         """
         Parse multiple PDFs together to enable accurate cross-document photo comparison.
@@ -165,8 +196,8 @@ class GeminiParser:
         from all documents simultaneously and perform accurate photo comparison across files.
         
         Args:
-            pdf_files: List of dicts with 'bytes' and 'filename' keys
-            
+            pdf_files: List of dicts with 'filename' plus either 'bytes' or 'blob_url' keys
+
         Returns:
             Consolidated parsed data with accurate cross-document photo comparison
         """
@@ -174,11 +205,12 @@ class GeminiParser:
         try:
             uploaded_files = []
             filenames = []
-            
+
             # Upload all PDFs to Gemini
             for pdf_file in pdf_files:
+                pdf_bytes = pdf_file.get('bytes') or self._download_pdf(pdf_file['blob_url'])
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                    tmp_file.write(pdf_file['bytes'])
+                    tmp_file.write(pdf_bytes)
                     tmp_paths.append(tmp_file.name)
                 
                 uploaded = genai.upload_file(tmp_file.name, mime_type="application/pdf")
@@ -53,6 +53,7 @@ class MongoDBClient:
             projects = db["projects"]
             await projects.create_index([("tenant_id", ASCENDING)])
             await projects.create_index([("tenant_id", ASCENDING), ("project_id", ASCENDING)], unique=True)
+            await projects.create_index([("tenant_id", ASCENDING), ("is_active", ASCENDING)])
             await projects.create_index([("created_at", DESCENDING)])
             logger.info("Created indexes for projects collection")
             
@@ -60,6 +61,7 @@ class MongoDBClient:
             ai_models = db["ai_models"]
             await ai_models.create_index([("tenant_id", ASCENDING)])
             await ai_models.create_index([("model_id", ASCENDING)], unique=True)
+            await ai_models.create_index([("tenant_id", ASCENDING), ("model_id", ASCENDING)], unique=True)
             await ai_models.create_index([("created_at", DESCENDING)])
             logger.info("Created indexes for ai_models collection")
             
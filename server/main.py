@@ -12,6 +12,7 @@ from contextlib import asynccontextmanager
 from server.config.settings import get_settings
 from server.core.exceptions import APIException
 from server.core.logging_config import configure_logging
+from server.integrations.azure_multitenant import close_async_blob_clients
 from server.integrations.mongodb import MongoDBClient
 
 
@@ -35,6 +36,7 @@ async def lifespan(app: FastAPI):
     # Cleanup on shutdown
     logger.info("Medical Report Parser API shutting down...")
     await MongoDBClient.close()
+    await close_async_blob_clients()
 
 
 def create_app() -> FastAPI:
@@ -133,4 +135,9 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        # uvicorn[standard] ships both; pin them explicitly so a missing
+        # extra fails loudly instead of silently falling back to the
+        # pure-Python loop and HTTP parser
+        loop="uvloop",
+        http="httptools",
     )
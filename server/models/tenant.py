@@ -4,7 +4,7 @@ All data stored exclusively in MongoDB, no local files.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Optional, List
 from pydantic import BaseModel, Field
 
@@ -23,7 +23,8 @@ class Tenant(BaseModel):
     name: str
     email: str
     api_key: str
-    created_at: str
+    # Stored as a BSON Date; pydantic coerces legacy ISO-string documents
+    created_at: datetime
     active: bool = True
     quota: Optional[TenantQuota] = Field(default_factory=TenantQuota)
 
@@ -55,7 +56,7 @@ class TenantManager:
             name=tenant_doc.get("name", "Unknown Tenant"),
             email=tenant_doc.get("email", "noemail@example.com"),
             api_key=tenant_doc.get("api_key", ""),
-            created_at=tenant_doc.get("created_at", datetime.utcnow().isoformat()),
+            created_at=tenant_doc.get("created_at", datetime.now(timezone.utc)),
             active=tenant_doc.get("active", True),
             quota=TenantQuota(
                 max_uploads_per_month=tenant_doc.get("quota", {}).get("max_uploads_per_month", 100),
@@ -187,5 +188,28 @@ class TenantManager:
         result = await db["tenants"].delete_one({"tenant_id": tenant_id})
         logger.info(f"Tenant {tenant_id} deleted from MongoDB. Deleted count: {result.deleted_count}")
 
+    async def find_one_and_delete(self, tenant_id: str) -> Optional[Tenant]:
+        """
+        Delete a tenant and return the removed document in one round-trip
+
+        Args:
+            tenant_id: ID of tenant to delete
+
+        Returns:
+            The deleted Tenant, or None if no tenant matched
+        """
+        db = await self._get_db()
+
+        # api_key is projected out so the returned audit copy never carries it
+        tenant_doc = await db["tenants"].find_one_and_delete(
+            {"tenant_id": tenant_id},
+            projection={"api_key": 0},
+        )
+        if not tenant_doc:
+            return None
+
+        logger.info(f"Tenant {tenant_id} deleted from MongoDB")
+        return self._doc_to_tenant(tenant_doc)
+
 
 tenant_manager = TenantManager()